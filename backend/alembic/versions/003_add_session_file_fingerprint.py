@@ -0,0 +1,29 @@
+"""Add session source file fingerprint
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(sa.Column("file_mtime_ns", sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column("file_size", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("file_size")
+        batch_op.drop_column("file_mtime_ns")
@@ -0,0 +1,28 @@
+"""Add covering index for tool usage counts
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tool_usages_category_names",
+        "tool_usages",
+        ["category", "tool_name", "skill_name", "mcp_server"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tool_usages_category_names", table_name="tool_usages")
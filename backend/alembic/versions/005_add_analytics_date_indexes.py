@@ -0,0 +1,28 @@
+"""Add date range indexes for agent, skill and MCP analytics
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tool_usages_category_timestamp", "tool_usages", ["category", "timestamp"]
+    )
+    op.create_index("ix_subagent_usages_timestamp", "subagent_usages", ["timestamp"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_subagent_usages_timestamp", table_name="subagent_usages")
+    op.drop_index("ix_tool_usages_category_timestamp", table_name="tool_usages")
@@ -49,7 +49,7 @@ from claude_coach.models import (
 )
 from claude_coach.api.deps import get_db
 from claude_coach.core.parser import LogParser
-from claude_coach.core.error_analyzer import ErrorAnalyzer
+from claude_coach.core.error_analyzer import DEFAULT_CACHE_DIR, ErrorAnalyzer
 
 router = APIRouter()
 
@@ -82,7 +82,7 @@ async def get_token_usage(
         stats = query.group_by(cast(Session.created_at, Date)).order_by(cast(Session.created_at, Date)).all()
 
         data_points = [
-            TokenDataPoint(
+            TokenDataPoint.model_construct(
                 date=str(s.date),
                 input_tokens=s.input_tokens or 0,
                 output_tokens=s.output_tokens or 0,
@@ -102,7 +102,7 @@ async def get_token_usage(
         stats = query.order_by(DailyStats.date).all()
 
         data_points = [
-            TokenDataPoint(
+            TokenDataPoint.model_construct(
                 date=str(s.date),
                 input_tokens=s.input_tokens,
                 output_tokens=s.output_tokens,
@@ -148,7 +148,7 @@ async def get_tool_usage(
     results = query.all()
 
     data_points = [
-        ToolDataPoint(tool_name=name, count=count)
+        ToolDataPoint.model_construct(tool_name=name, count=count)
         for name, count in results
     ]
 
@@ -198,7 +198,7 @@ async def get_error_stats(
         )
 
     data_points = [
-        ErrorDataPoint(error_type=err_type, count=int(total))
+        ErrorDataPoint.model_construct(error_type=err_type, count=int(total))
         for err_type, total in results
     ]
 
@@ -229,7 +229,7 @@ async def get_context_growth(
     )
 
     data_points = [
-        ContextDataPoint(
+        ContextDataPoint.model_construct(
             message_index=m.message_index,
             context_tokens=m.cumulative_context_tokens or 0,
             timestamp=m.timestamp.isoformat() if m.timestamp else None,
@@ -243,8 +243,10 @@ async def get_context_growth(
     )
 
 
+# Plain def: FastAPI runs it in its threadpool, so parsing session logs
+# doesn't block the event loop
 @router.get("/plan-mode", response_model=PlanModeResponse)
-async def get_plan_mode_stats(
+def get_plan_mode_stats(
     db: DBSession = Depends(get_db),
 ):
     """Get planning vs execution mode statistics.
@@ -329,8 +331,13 @@ async def get_plan_mode_stats(
     )
 
 
-@router.get("/error-analysis", response_model=ErrorAnalysisResponse)
-async def get_error_analysis(
+# The error-analysis routes read session logs too, so they are plain def as well
+# Null fields are dropped from the error analysis responses; the frontend
+# types already treat them as optional
+@router.get(
+    "/error-analysis", response_model=ErrorAnalysisResponse, response_model_exclude_none=True
+)
+def get_error_analysis(
     project: Optional[str] = Query(None, description="Filter by project path substring"),
     limit: int = Query(500, description="Maximum number of errors to analyze"),
 ):
@@ -339,7 +346,7 @@ async def get_error_analysis(
     Analyzes tool errors from session logs, categorizes them,
     and provides actionable suggestions for reducing errors.
     """
-    analyzer = ErrorAnalyzer()
+    analyzer = ErrorAnalyzer(cache_dir=DEFAULT_CACHE_DIR)
     errors = analyzer.get_project_errors(project_filter=project, limit=limit)
     analysis = analyzer.analyze_errors(errors)
 
@@ -366,7 +373,7 @@ async def get_error_analysis(
         by_category=categories,
         by_tool=[ToolErrorSummary(**tool) for tool in analysis["by_tool"]],
         recent_errors=[
-            ToolErrorDetail(
+            ToolErrorDetail.model_construct(
                 tool_name=e.tool_name,
                 error_message=e.error_message,
                 error_category=e.error_category,
@@ -384,7 +391,7 @@ async def get_error_analysis(
 
 
 @router.get("/error-analysis/timeframe", response_model=TimeframeErrorsResponse)
-async def get_errors_by_timeframe(
+def get_errors_by_timeframe(
     days: int = Query(7, description="Number of days to look back"),
     project: Optional[str] = Query(None, description="Filter by project path substring"),
 ):
@@ -393,7 +400,7 @@ async def get_errors_by_timeframe(
     Returns daily error counts and actionable issues for the last N days.
     Useful for tracking error trends and identifying recurring issues.
     """
-    analyzer = ErrorAnalyzer()
+    analyzer = ErrorAnalyzer(cache_dir=DEFAULT_CACHE_DIR)
     result = analyzer.get_errors_by_timeframe(days=days, project_filter=project)
 
     return TimeframeErrorsResponse(
@@ -404,8 +411,12 @@ async def get_errors_by_timeframe(
     )
 
 
-@router.get("/error-analysis/session/{session_id}", response_model=SessionErrorsResponse)
-async def get_session_errors(
+@router.get(
+    "/error-analysis/session/{session_id}",
+    response_model=SessionErrorsResponse,
+    response_model_exclude_none=True,
+)
+def get_session_errors(
     session_id: str,
 ):
     """Get detailed error analysis for a specific session.
@@ -413,7 +424,7 @@ async def get_session_errors(
     Returns all tool errors for the session with categorization
     and suggestions for improvement.
     """
-    analyzer = ErrorAnalyzer()
+    analyzer = ErrorAnalyzer(cache_dir=DEFAULT_CACHE_DIR)
     errors = analyzer.get_session_errors(session_id)
 
     if errors is None:
@@ -432,7 +443,7 @@ async def get_session_errors(
             ErrorCategorySummary(**cat) for cat in analysis["by_category"]
         ],
         errors=[
-            ToolErrorDetail(
+            ToolErrorDetail.model_construct(
                 tool_name=e.tool_name,
                 error_message=e.error_message,
                 error_category=e.error_category,
@@ -169,16 +169,5 @@ async def get_insights(
 ):
     """Get personalized insights and recommendations based on your usage."""
     engine = InsightsEngine(db)
-    insights = engine.generate_all_insights()
-
-    return [
-        {
-            "category": i.category,
-            "title": i.title,
-            "description": i.description,
-            "severity": i.severity,
-            "metric_value": i.metric_value,
-            "metric_label": i.metric_label,
-        }
-        for i in insights
-    ]
+    # Cached JSON body; Insight fields are exactly the documented keys
+    return Response(content=engine.generate_all_insights_json(), media_type="application/json")
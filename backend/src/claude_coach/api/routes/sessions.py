@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, func
 
 from claude_coach.schemas.session import (
     SessionList,
@@ -54,19 +54,36 @@ async def list_sessions(
     db: DBSession = Depends(get_db),
 ):
     """List all sessions with optional filtering."""
-    query = db.query(Session)
-
+    filters: list[ColumnElement[bool]] = []
     if project:
-        query = query.filter(Session.project_path.in_(project))
+        filters.append(Session.project_path.in_(project))
     if branch:
-        query = query.filter(Session.git_branch == branch)
-
-    total = query.count()
-    sessions = query.order_by(Session.created_at.desc()).offset(offset).limit(limit).all()
+        filters.append(Session.git_branch == branch)
+
+    total = db.query(func.count(Session.id)).filter(*filters).scalar()
+
+    # Load only the listed columns as plain rows rather than full Session entities
+    sessions = (
+        db.query(
+            Session.session_id,
+            Session.project_path,
+            Session.first_prompt,
+            Session.summary,
+            Session.message_count,
+            Session.created_at,
+            Session.modified_at,
+            Session.git_branch,
+        )
+        .filter(*filters)
+        .order_by(Session.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
 
     return SessionList(
         sessions=[
-            SessionSchema(
+            SessionSchema.model_construct(
                 session_id=s.session_id,
                 project_path=s.project_path,
                 first_prompt=s.first_prompt or "",
@@ -166,7 +183,13 @@ async def get_session_messages(
     )
 
 
-@router.get("/{session_id}/timeline", response_model=SessionTimelineResponse)
+# Each event uses only a few of TimelineEvent's optional fields; dropping the
+# nulls keeps the payload small and the frontend already treats them as optional.
+@router.get(
+    "/{session_id}/timeline",
+    response_model=SessionTimelineResponse,
+    response_model_exclude_none=True,
+)
 async def get_session_timeline(
     session_id: str,
     db: DBSession = Depends(get_db),
@@ -208,8 +231,10 @@ async def get_session_timeline(
         .order_by(Message.message_index)
         .all()
     )
+    # Every field below comes straight from typed DB columns, so the events
+    # are built with model_construct to skip per-event validation.
     for m in messages:
-        events.append(TimelineEvent(
+        events.append(TimelineEvent.model_construct(
             type=f"{m.role}_message",
             timestamp=m.timestamp.isoformat() if m.timestamp else None,
             role=m.role,
@@ -237,7 +262,7 @@ async def get_session_timeline(
         elif category == "skill":
             skill_count += 1
 
-        event = TimelineEvent(
+        event = TimelineEvent.model_construct(
             type="tool_call" if category in ("native", "mcp") else (
                 "agent_spawn" if category == "agent" else "skill_invoke"
             ),
@@ -267,7 +292,7 @@ async def get_session_timeline(
         .all()
     )
     for e in errors:
-        events.append(TimelineEvent(
+        events.append(TimelineEvent.model_construct(
             type="error",
             timestamp=e.timestamp.isoformat() if e.timestamp else None,
             error_type=e.error_type,
@@ -1,10 +1,11 @@
 """Analytics engine for Claude Code logs."""
 
 import json
+import re
 from pathlib import Path
 from typing import Optional
 from datetime import date, datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from claude_coach.schemas.analytics import (
     TokenUsageResponse,
@@ -18,6 +19,17 @@ from claude_coach.schemas.analytics import (
 )
 from claude_coach.core.parser import LogParser
 
+# Session logs are named <uuid>.jsonl; anything else (agent-*.jsonl etc.) is skipped
+_SESSION_ID_RE = re.compile(r"[0-9a-f-]{36}")
+
+
+def _session_files(project_dir: Path) -> list[Path]:
+    """List session JSONL files in a project directory without globbing."""
+    return [
+        p for p in project_dir.iterdir()
+        if p.suffix == ".jsonl" and _SESSION_ID_RE.fullmatch(p.stem)
+    ]
+
 
 class Analyzer:
     """Analyze Claude Code logs for insights."""
@@ -70,7 +82,7 @@ class Analyzer:
                 daily_tokens[date_key]["cache_create"] += detail.total_cache_creation_tokens
 
         data_points = [
-            TokenDataPoint(
+            TokenDataPoint.model_construct(
                 date=date_str,
                 input_tokens=tokens["input"],
                 output_tokens=tokens["output"],
@@ -95,13 +107,10 @@ class Analyzer:
         end_date: Optional[date] = None,
     ) -> ToolUsageResponse:
         """Get tool usage statistics."""
-        tool_counts = defaultdict(int)
+        tool_counts: Counter[str] = Counter()
 
         for project_dir in self.parser._get_project_dirs():
-            for session_file in project_dir.glob("*.jsonl"):
-                if session_file.name == "sessions-index.json":
-                    continue
-
+            for session_file in _session_files(project_dir):
                 with open(session_file) as f:
                     for line in f:
                         try:
@@ -116,13 +125,13 @@ class Analyzer:
                             continue
 
         data_points = [
-            ToolDataPoint(tool_name=name, count=count)
-            for name, count in sorted(tool_counts.items(), key=lambda x: -x[1])
+            ToolDataPoint.model_construct(tool_name=name, count=count)
+            for name, count in tool_counts.most_common()
         ]
 
         return ToolUsageResponse(
             data=data_points,
-            total_tool_calls=sum(tool_counts.values()),
+            total_tool_calls=tool_counts.total(),
         )
 
     def get_error_stats(
@@ -131,13 +140,10 @@ class Analyzer:
         end_date: Optional[date] = None,
     ) -> ErrorStatsResponse:
         """Get error statistics."""
-        error_types = defaultdict(int)
+        error_types: Counter[str] = Counter()
 
         for project_dir in self.parser._get_project_dirs():
-            for session_file in project_dir.glob("*.jsonl"):
-                if session_file.name == "sessions-index.json":
-                    continue
-
+            for session_file in _session_files(project_dir):
                 with open(session_file) as f:
                     for line in f:
                         try:
@@ -150,13 +156,13 @@ class Analyzer:
                             continue
 
         data_points = [
-            ErrorDataPoint(error_type=err_type, count=count)
-            for err_type, count in sorted(error_types.items(), key=lambda x: -x[1])
+            ErrorDataPoint.model_construct(error_type=err_type, count=count)
+            for err_type, count in error_types.most_common()
         ]
 
         return ErrorStatsResponse(
             data=data_points,
-            total_errors=sum(error_types.values()),
+            total_errors=error_types.total(),
         )
 
     def get_context_growth(self, session_id: str) -> ContextGrowthResponse:
@@ -165,11 +171,8 @@ class Analyzer:
         cumulative_tokens = 0
         message_index = 0
 
-        for project_dir in self.parser._get_project_dirs():
-            session_file = project_dir / f"{session_id}.jsonl"
-            if not session_file.exists():
-                continue
-
+        session_file = self.parser._session_path(session_id)
+        if session_file is not None:
             with open(session_file) as f:
                 for line in f:
                     try:
@@ -183,14 +186,13 @@ class Analyzer:
                             cumulative_tokens = input_tokens + cache_read
                             message_index += 1
 
-                            data_points.append(ContextDataPoint(
+                            data_points.append(ContextDataPoint.model_construct(
                                 message_index=message_index,
                                 context_tokens=cumulative_tokens,
                                 timestamp=event.get("timestamp"),
                             ))
                     except json.JSONDecodeError:
                         continue
-            break
 
         return ContextGrowthResponse(
             session_id=session_id,
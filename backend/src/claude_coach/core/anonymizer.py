@@ -3,7 +3,7 @@
 from datetime import date, timedelta
 from typing import Optional
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from claude_coach.models import (
     Session,
@@ -36,14 +36,24 @@ class MetricsAnonymizer:
         if start_date is None:
             start_date = end_date - timedelta(days=30)
 
-        # Query sessions in date range
-        sessions_query = self.db.query(Session).filter(
+        # Aggregate session stats in one query rather than loading each session
+        in_range = (
             Session.created_at >= start_date,
             Session.created_at <= end_date,
         )
-
-        sessions = sessions_query.all()
-        total_sessions = len(sessions)
+        totals = self.db.query(
+            func.count(Session.id).label("sessions"),
+            func.sum(Session.message_count).label("messages"),
+            func.sum(Session.total_input_tokens).label("input"),
+            func.sum(Session.total_output_tokens).label("output"),
+            func.sum(Session.total_cache_read_tokens).label("cache_read"),
+            func.sum(Session.total_cache_creation_tokens).label("cache_create"),
+            func.sum(Session.tool_call_count).label("tool_calls"),
+            func.sum(Session.error_count).label("errors"),
+            # Zero and missing durations are left out of the average
+            func.avg(func.nullif(Session.duration_ms, 0)).label("avg_duration_ms"),
+        ).filter(*in_range).one()
+        total_sessions = totals.sessions
 
         if total_sessions == 0:
             return AnonymizedMetrics(
@@ -64,23 +74,21 @@ class MetricsAnonymizer:
                 avg_tools_per_session=0,
             )
 
-        # Aggregate session stats
-        total_messages = sum(s.message_count for s in sessions)
-        total_input_tokens = sum(s.total_input_tokens for s in sessions)
-        total_output_tokens = sum(s.total_output_tokens for s in sessions)
-        total_cache_read = sum(s.total_cache_read_tokens for s in sessions)
-        total_cache_create = sum(s.total_cache_creation_tokens for s in sessions)
-        total_tool_calls = sum(s.tool_call_count for s in sessions)
-        total_errors = sum(s.error_count for s in sessions)
+        total_messages = totals.messages
+        total_input_tokens = totals.input
+        total_output_tokens = totals.output
+        total_cache_read = totals.cache_read
+        total_cache_create = totals.cache_create
+        total_tool_calls = totals.tool_calls
+        total_errors = totals.errors
 
         # Calculate duration (if available)
-        durations = [s.duration_ms for s in sessions if s.duration_ms]
         avg_duration_minutes = None
-        if durations:
-            avg_duration_minutes = (sum(durations) / len(durations)) / 60000
+        if totals.avg_duration_ms is not None:
+            avg_duration_minutes = totals.avg_duration_ms / 60000
 
         # Tool usage counts
-        session_ids = [s.id for s in sessions]
+        session_ids = select(Session.id).where(*in_range)
         tool_counts = (
             self.db.query(ToolUsage.tool_name, func.count(ToolUsage.id))
             .filter(ToolUsage.session_id.in_(session_ids))
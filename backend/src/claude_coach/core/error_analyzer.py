@@ -1,15 +1,31 @@
 """Error analyzer for Claude Code session logs."""
 
+import hashlib
 import json
+import multiprocessing
+import os
+import pickle
 import re
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional
-from collections import defaultdict
+from typing import Optional, cast
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from operator import attrgetter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+from claude_coach.core import jsonl
+from claude_coach.models.database import DEFAULT_DB_PATH
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolError:
     """Represents a tool error from a session."""
 
@@ -23,7 +39,7 @@ class ToolError:
     subcategory: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionableIssue:
     """An actionable issue that can be fixed."""
 
@@ -35,6 +51,9 @@ class ActionableIssue:
     example_errors: list[str] = field(default_factory=list)
 
 
+_TOOL_NAME_RE = re.compile(r"no such tool available: (\S+)")
+
+
 # Error categories with descriptions and suggestions
 ERROR_CATEGORIES = {
     "file_not_found": {
@@ -103,12 +122,24 @@ ERROR_CATEGORIES = {
     },
 }
 
+# (description, suggestion) per category, resolved once at import
+_CATEGORY_TEXT = {
+    name: (info["description"], info["suggestion"]) for name, info in ERROR_CATEGORIES.items()
+}
+
 
+@lru_cache(maxsize=4096)
 def categorize_error(error_message: str) -> str:
-    """Categorize an error based on its message."""
+    """Categorize an error based on its message.
+
+    Each check is a substring scan of the whole message, so redundant scans are
+    avoided and compound checks test their rarest keyword first. Results are
+    memoized since identical tool errors recur across sessions.
+    """
     err = error_message.lower()
 
-    if "does not exist" in err or "no such file" in err or "path does not exist" in err:
+    # "path does not exist" is covered by "does not exist"
+    if "does not exist" in err or "no such file" in err:
         return "file_not_found"
     if "eisdir" in err:
         return "directory_instead_of_file"
@@ -118,13 +149,16 @@ def categorize_error(error_message: str) -> str:
         return "user_rejected"
     if "old_string" in err and "not found" in err:
         return "edit_string_not_found"
-    if "found" in err and "matches" in err and "replace_all" in err:
+    if "replace_all" in err and "matches" in err and "found" in err:
         return "edit_multiple_matches"
     if "file has not been read yet" in err:
         return "file_not_read_first"
     if "exit code" in err:
         return "command_failed"
-    if "status code 404" in err or "status code 403" in err or "status code 429" in err or "request failed" in err:
+    if (
+        "status code 4" in err
+        and ("status code 404" in err or "status code 403" in err or "status code 429" in err)
+    ) or "request failed" in err:
         return "http_error"
     if "exceeds maximum" in err and "tokens" in err:
         return "file_too_large"
@@ -142,18 +176,42 @@ def categorize_error(error_message: str) -> str:
     return "other"
 
 
+def _extract_exit_code(err: str) -> Optional[str]:
+    """Extract the digits following "exit code " in a lowercased error message."""
+    start = err.find("exit code ")
+    while start >= 0:
+        start += len("exit code ")
+        end = start
+        while end < len(err) and err[end].isdigit():
+            end += 1
+        if end > start:
+            return err[start:end]
+        start = err.find("exit code ", start)
+    return None
+
+
+# Categories that get_subcategory breaks down further
+_SUBCATEGORIZED = frozenset({"command_failed", "http_error", "tool_not_available"})
+
+
 def get_subcategory(error: "ToolError") -> Optional[str]:
     """Get detailed subcategory for an error."""
-    err = error.error_message.lower()
+    if error.error_category not in _SUBCATEGORIZED:
+        return None
     tool_input = error.tool_input or {}
     command = tool_input.get("command", "") or ""
+    if not isinstance(command, str):
+        command = ""
+    return _subcategory(error.error_category, error.error_message, command)
 
-    if error.error_category == "command_failed":
-        # Extract exit code
-        exit_code = None
-        match = re.search(r"exit code (\d+)", err)
-        if match:
-            exit_code = match.group(1)
+
+@lru_cache(maxsize=4096)
+def _subcategory(category: str, error_message: str, command: str) -> Optional[str]:
+    """Compute a subcategory from an error's category, message and command."""
+    err = error_message.lower()
+
+    if category == "command_failed":
+        exit_code = _extract_exit_code(err)
 
         # Categorize by command type
         first_word = command.split()[0] if command.split() else ""
@@ -186,9 +244,9 @@ def get_subcategory(error: "ToolError") -> Optional[str]:
         if first_word in ["pip", "pip3"]:
             return "pip_error"
 
-        return f"exit_code_{exit_code}" if exit_code else None
+        return sys.intern(f"exit_code_{exit_code}") if exit_code else None
 
-    elif error.error_category == "http_error":
+    elif category == "http_error":
         if "404" in err:
             return "404_not_found"
         if "403" in err:
@@ -198,69 +256,317 @@ def get_subcategory(error: "ToolError") -> Optional[str]:
         if "500" in err or "502" in err or "503" in err:
             return "5xx_server_error"
 
-    elif error.error_category == "tool_not_available":
+    elif category == "tool_not_available":
         # Extract tool name
-        match = re.search(r"no such tool available: (\S+)", err)
+        match = _TOOL_NAME_RE.search(err)
         if match:
-            return match.group(1)
+            return sys.intern(match.group(1))
 
     return None
 
 
-# Actionable issue definitions
+# Actionable issue definitions; the matching rules live in _match_actionable
 ACTIONABLE_PATTERNS = {
     "missing_venv": {
         "description": "Python virtual environment not found",
         "fix": "Create venv before starting work. Add to CLAUDE.md: 'Always check if .venv exists and activate it before running Python commands.'",
-        "pattern": lambda err, inp: "no such file or directory: .venv" in err.lower(),
     },
     "docker_not_running": {
         "description": "Docker containers not running",
         "fix": "Start Docker containers before running commands. Add to CLAUDE.md: 'Run docker-compose up -d before executing backend commands.'",
-        "pattern": lambda err, inp: "is not running" in err.lower() and "docker" in (inp.get("command", "") or "").lower(),
     },
     "edit_without_read": {
         "description": "Claude tried to edit files without reading them first",
         "fix": "Add to CLAUDE.md: 'ALWAYS read a file before editing it. Never assume file contents.'",
-        "pattern": lambda err, inp: "file has not been read yet" in err.lower(),
     },
     "git_auth_error": {
         "description": "Git authentication or branch errors",
         "fix": "Check git credentials are configured. Verify branch names before checkout. Add to CLAUDE.md: 'Always verify branch exists with git branch -a before checkout.'",
-        "pattern": lambda err, inp: "exit code 128" in err.lower() and "git" in (inp.get("command", "") or "").lower(),
     },
     "mcp_not_configured": {
         "description": "MCP tools not available",
         "fix": "Configure the required MCP server in claude_desktop_config.json or remove references to unavailable tools.",
-        "pattern": lambda err, inp: "no such tool available" in err.lower(),
     },
     "db_connection_failed": {
         "description": "Database connection failures",
         "fix": "Ensure database server is running. Check connection credentials. Add to CLAUDE.md: 'Verify database is accessible before running queries.'",
-        "pattern": lambda err, inp: "error connecting to database" in err.lower() or "failed to connect" in err.lower(),
     },
     "test_failures": {
         "description": "Test suite failures",
         "fix": "Review test output for specific failures. Consider running tests in smaller batches to identify issues.",
-        "pattern": lambda err, inp: "exit code 1" in err.lower() and ("pytest" in (inp.get("command", "") or "").lower() or "test" in (inp.get("command", "") or "").lower()),
     },
     "command_not_found": {
         "description": "Commands not found in PATH",
         "fix": "Install missing tools or activate the correct environment. Add to CLAUDE.md: 'Activate virtual environment before running Python tools.'",
-        "pattern": lambda err, inp: "command not found" in err.lower() or "exit code 127" in err.lower(),
     },
 }
 
+# Error cache location used by the API, in the app's own data directory
+DEFAULT_CACHE_DIR = DEFAULT_DB_PATH.parent / "error_cache"
+
+# Bump when parsing or categorization changes so cached error lists are rebuilt
+_CACHE_VERSION = 2
+
+# Temp files younger than this may still be being written, so pruning skips them
+_TMP_FILE_GRACE_SECONDS = 3600
+
+# Below this many session files, parsing serially beats a round trip to the pool
+PARALLEL_MIN_FILES = 4
+
+# Worker pool shared by every analyzer in the process. Started on first use and
+# kept for later requests, so no request pays for starting workers.
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, starting it if needed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned rather than forked: the API calls this from request
+            # threads, and forking a threaded process can deadlock the child
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _match_actionable(err: str, cmd: str) -> list[str]:
+    """Return the ACTIONABLE_PATTERNS issue types an error matches.
+
+    Takes the lowercased error message and the lowercased Bash command (empty
+    when the tool had none). Issue types are returned in ACTIONABLE_PATTERNS
+    order.
+    """
+    matches = []
+    if "no such file or directory: .venv" in err:
+        matches.append("missing_venv")
+    if "is not running" in err and "docker" in cmd:
+        matches.append("docker_not_running")
+    if "file has not been read yet" in err:
+        matches.append("edit_without_read")
+    # Prefix of exit codes 127 and 128 too, so it gates all three checks
+    exit_code_1x = "exit code 1" in err
+    if exit_code_1x and "exit code 128" in err and "git" in cmd:
+        matches.append("git_auth_error")
+    if "no such tool available" in err:
+        matches.append("mcp_not_configured")
+    if "error connecting to database" in err or "failed to connect" in err:
+        matches.append("db_connection_failed")
+    # "test" also covers "pytest"
+    if exit_code_1x and "test" in cmd:
+        matches.append("test_failures")
+    if "command not found" in err or (exit_code_1x and "exit code 127" in err):
+        matches.append("command_not_found")
+    return matches
+
+
+def _parse_session_errors(
+    session_file: Path,
+    project_path: str,
+    max_errors: Optional[int] = None,
+    cutoff_iso: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+) -> list[ToolError]:
+    """Parse tool errors from a session file.
+
+    Stops reading the file once max_errors errors have been collected. With
+    cutoff_iso (a UTC "YYYY-MM-DDTHH:MM:SS" string), tool calls timestamped
+    before the cutoff are ignored, so their errors are never built.
+
+    With cache_dir, the file's full error list is cached there and reused
+    until the file's mtime or size changes; limits are applied to the list.
+    """
+    if cache_dir is None:
+        return _scan_session_errors(session_file, project_path, max_errors, cutoff_iso)
+
+    stat = session_file.stat()
+    cache_file = cache_dir / _cache_name(session_file)
+    errors = _load_cached(cache_file, stat)
+    if errors is None:
+        errors = _scan_session_errors(session_file, project_path)
+        _store_cached(cache_file, stat, errors)
+
+    if cutoff_iso is not None:
+        errors = [
+            e for e in errors if isinstance(e.timestamp, str) and e.timestamp >= cutoff_iso
+        ]
+    if max_errors is not None:
+        errors = errors[:max_errors]
+    return errors
+
+
+def _cache_name(session_file: Path) -> str:
+    """File name of a session file's entry in the error cache."""
+    return f"{hashlib.sha1(str(session_file).encode()).hexdigest()}.pickle"
+
+
+def _prune_cache(cache_dir: Path, live_names: set[str]) -> None:
+    """Delete cache entries not in live_names, and abandoned temp files.
+
+    Other files in cache_dir are left alone. Temp files may still be written
+    by another thread or process, so only ones older than
+    _TMP_FILE_GRACE_SECONDS are deleted.
+    """
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    tmp_cutoff = time.time() - _TMP_FILE_GRACE_SECONDS
+    for entry in entries:
+        try:
+            if entry.name.endswith(".pickle"):
+                if entry.name in live_names:
+                    continue
+            elif not entry.name.endswith(".tmp") or entry.stat().st_mtime > tmp_cutoff:
+                continue
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _load_cached(cache_file: Path, stat: os.stat_result) -> Optional[list[ToolError]]:
+    """Load cached errors for a session file, or None if missing or stale."""
+    try:
+        with open(cache_file, "rb") as f:
+            version, mtime_ns, size, errors = pickle.load(f)
+    except Exception:
+        # Corrupt entries and ones pickled from since-renamed classes can raise
+        # almost anything; a cache read must never fail the request
+        return None
+    if (version, mtime_ns, size) != (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size):
+        return None
+    return cast(list[ToolError], errors)
+
+
+def _store_cached(cache_file: Path, stat: os.stat_result, errors: list[ToolError]) -> None:
+    """Write errors to the cache; failures only cost a re-parse next time."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp name per write: concurrent requests for the same
+        # session must not interleave their writes in one file
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent, prefix=f"{cache_file.stem}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_file = f.name
+            pickle.dump(
+                (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, errors),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _scan_session_errors(
+    session_file: Path,
+    project_path: str,
+    max_errors: Optional[int] = None,
+    cutoff_iso: Optional[str] = None,
+) -> list[ToolError]:
+    """Read tool errors from a session file; see _parse_session_errors."""
+    errors = []
+    session_tool_uses = {}  # tool_use_id -> {name, input, timestamp}
+    session_id = session_file.stem
+
+    loads = jsonl.loads  # local alias, looked up once per line
+
+    # Binary-mode line iteration splits lines in C without decoding; it measured
+    # faster than scanning an mmap for newlines from Python.
+    with open(session_file, "rb") as f:
+        for line in f:
+            try:
+                event = loads(line)
+                event_type = event.get("type")
+
+                # Track tool_use from assistant messages
+                if event_type == "assistant":
+                    timestamp = event.get("timestamp")
+                    # ISO-8601 UTC timestamps sort lexicographically
+                    if cutoff_iso is not None and (
+                        not isinstance(timestamp, str) or timestamp < cutoff_iso
+                    ):
+                        continue
+                    content = event.get("message", {}).get("content", [])
+                    if not isinstance(content, list):
+                        continue
+                    for part in content:
+                        if part.get("type") != "tool_use":
+                            continue
+                        session_tool_uses[part.get("id")] = {
+                            "name": part.get("name"),
+                            "input": part.get("input", {}),
+                            "timestamp": timestamp,
+                        }
+
+                # Check tool results for errors
+                elif event_type == "user":
+                    content = event.get("message", {}).get("content", [])
+                    if not isinstance(content, list):
+                        continue
+                    for part in content:
+                        # Most parts are successful results or text; test is_error first
+                        if not part.get("is_error") or part.get("type") != "tool_result":
+                            continue
+                        tool_id = part.get("tool_use_id")
+                        if cutoff_iso is not None and tool_id not in session_tool_uses:
+                            continue
+                        # Only the stored prefix is categorized, so the memoized
+                        # categorize_error never keeps whole tool outputs alive
+                        error_message = str(part.get("content", ""))[:1000]
+                        tool_info = session_tool_uses.get(tool_id, {})
+                        # Tool names come from a small vocabulary; share one copy
+                        tool_name = tool_info.get("name", "unknown")
+                        if isinstance(tool_name, str):
+                            tool_name = sys.intern(tool_name)
+
+                        error = ToolError(
+                            tool_name=tool_name,
+                            error_message=error_message,
+                            error_category=categorize_error(error_message),
+                            timestamp=tool_info.get("timestamp"),
+                            session_id=session_id,
+                            project_path=project_path,
+                            tool_input=tool_info.get("input"),
+                        )
+                        error.subcategory = get_subcategory(error)
+                        errors.append(error)
+                        if max_errors is not None and len(errors) >= max_errors:
+                            return errors
+
+            except (json.JSONDecodeError, IOError):
+                continue
+
+    return errors
+
 
 class ErrorAnalyzer:
     """Analyze tool errors from Claude Code sessions."""
 
-    def __init__(self, claude_dir: Optional[Path] = None):
-        """Initialize analyzer with Claude config directory."""
+    def __init__(self, claude_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
+        """Initialize analyzer with Claude config directory.
+
+        With cache_dir (e.g. DEFAULT_CACHE_DIR), parsed errors are cached there
+        per session file; get_project_errors drops entries whose session file
+        is gone.
+        """
         if claude_dir is None:
             claude_dir = Path.home() / ".claude"
         self.claude_dir = claude_dir
         self.projects_dir = claude_dir / "projects"
+        self.cache_dir = cache_dir
 
     def _get_project_dirs(self) -> list[Path]:
         """Get all project directories."""
@@ -268,147 +574,166 @@ class ErrorAnalyzer:
             return []
         return [d for d in self.projects_dir.iterdir() if d.is_dir()]
 
-    def _parse_session_errors(
-        self, session_file: Path, project_path: str
-    ) -> list[ToolError]:
-        """Parse tool errors from a session file."""
-        errors = []
-        session_tool_uses = {}  # tool_use_id -> {name, input, timestamp}
-
-        with open(session_file) as f:
-            for line in f:
-                try:
-                    event = json.loads(line)
-
-                    # Track tool_use from assistant messages
-                    if event.get("type") == "assistant":
-                        timestamp = event.get("timestamp")
-                        content = event.get("message", {}).get("content", [])
-                        if isinstance(content, list):
-                            for part in content:
-                                if part.get("type") == "tool_use":
-                                    tool_id = part.get("id")
-                                    session_tool_uses[tool_id] = {
-                                        "name": part.get("name"),
-                                        "input": part.get("input", {}),
-                                        "timestamp": timestamp,
-                                    }
-
-                    # Check tool results for errors
-                    if event.get("type") == "user":
-                        content = event.get("message", {}).get("content", [])
-                        if isinstance(content, list):
-                            for part in content:
-                                if (
-                                    part.get("type") == "tool_result"
-                                    and part.get("is_error")
-                                ):
-                                    tool_id = part.get("tool_use_id")
-                                    result_content = str(part.get("content", ""))
-                                    tool_info = session_tool_uses.get(tool_id, {})
-
-                                    error = ToolError(
-                                        tool_name=tool_info.get("name", "unknown"),
-                                        error_message=result_content[:1000],
-                                        error_category=categorize_error(
-                                            result_content
-                                        ),
-                                        timestamp=tool_info.get("timestamp"),
-                                        session_id=session_file.stem,
-                                        project_path=project_path,
-                                        tool_input=tool_info.get("input"),
-                                    )
-                                    error.subcategory = get_subcategory(error)
-                                    errors.append(error)
-
-                except (json.JSONDecodeError, IOError):
-                    continue
-
-        return errors
-
     def get_session_errors(self, session_id: str) -> Optional[list[ToolError]]:
         """Get all errors for a specific session."""
         for project_dir in self._get_project_dirs():
             session_file = project_dir / f"{session_id}.jsonl"
             if session_file.exists():
                 project_path = str(project_dir.name).replace("-", "/")
-                return self._parse_session_errors(session_file, project_path)
+                return _parse_session_errors(
+                    session_file, project_path, cache_dir=self.cache_dir
+                )
         return None
 
     def get_project_errors(
-        self, project_filter: Optional[str] = None, limit: int = 1000
+        self,
+        project_filter: Optional[str] = None,
+        limit: int = 1000,
+        since: Optional[datetime] = None,
     ) -> list[ToolError]:
-        """Get all errors, optionally filtered by project."""
-        all_errors = []
+        """Get all errors, optionally filtered by project.
+
+        Files are scanned until limit errors are collected, so limit is a cap
+        on work as well as output: the result is the newest errors among those
+        scanned, not necessarily the newest overall.
+
+        With since (timezone-aware), errors from earlier tool calls are skipped
+        during parsing and files last modified before it are not opened.
+        """
+        cutoff_iso = None
+        if since is not None:
+            cutoff_iso = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+        all_errors: list[ToolError] = []
 
+        session_files = []
+        live_cache_names: set[str] = set()
         for project_dir in self._get_project_dirs():
-            project_path = str(project_dir.name).replace("-", "/")
+            project_path = sys.intern(str(project_dir.name).replace("-", "/"))
+            project_files = list(project_dir.glob("*.jsonl"))
+            if self.cache_dir is not None:
+                live_cache_names.update(_cache_name(f) for f in project_files)
 
             if project_filter and project_filter not in project_path:
                 continue
 
-            for session_file in project_dir.glob("*.jsonl"):
-                errors = self._parse_session_errors(session_file, project_path)
-                all_errors.extend(errors)
-
+            for session_file in project_files:
+                if since is not None and session_file.stat().st_mtime < since.timestamp():
+                    continue
+                session_files.append((session_file, project_path))
+
+        if self.cache_dir is not None:
+            _prune_cache(self.cache_dir, live_cache_names)
+
+        if len(session_files) < PARALLEL_MIN_FILES:
+            for session_file, project_path in session_files:
+                all_errors.extend(_parse_session_errors(
+                    session_file,
+                    project_path,
+                    limit - len(all_errors),
+                    cutoff_iso,
+                    self.cache_dir,
+                ))
                 if len(all_errors) >= limit:
                     break
+        else:
+            all_errors = self._parse_in_pool(session_files, limit, cutoff_iso)
 
-            if len(all_errors) >= limit:
-                break
+        # At most limit errors were collected; sort by timestamp, newest first,
+        # with untimestamped errors last
+        timed = [e for e in all_errors if e.timestamp]
+        timed.sort(key=attrgetter("timestamp"), reverse=True)
+        timed.extend(e for e in all_errors if not e.timestamp)
+        return timed
 
-        # Sort by timestamp, newest first
-        all_errors.sort(key=lambda e: e.timestamp or "", reverse=True)
-        return all_errors[:limit]
+    def _parse_in_pool(
+        self,
+        session_files: list[tuple[Path, str]],
+        limit: int,
+        cutoff_iso: Optional[str],
+    ) -> list[ToolError]:
+        """Parse session files in the shared pool, collecting errors in scan order.
+
+        Only a bounded window of files is in flight. Each file is asked for the
+        errors still missing when it is submitted, and files left pending once
+        limit is reached are cancelled.
+        """
+        pool = _get_pool()
+        window = 2 * (os.cpu_count() or 1)
+        files = iter(session_files)
+        pending: deque[Future[list[ToolError]]] = deque()
+        all_errors: list[ToolError] = []
+        try:
+            while len(all_errors) < limit:
+                for session_file, project_path in islice(files, window - len(pending)):
+                    pending.append(pool.submit(
+                        _parse_session_errors,
+                        session_file,
+                        project_path,
+                        limit - len(all_errors),
+                        cutoff_iso,
+                        self.cache_dir,
+                    ))
+                if not pending:
+                    break
+                all_errors.extend(pending.popleft().result())
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+        # Files in flight together may each have filled the remaining budget
+        del all_errors[limit:]
+        return all_errors
 
     def analyze_errors(
         self,
         errors: list[ToolError],
     ) -> dict:
         """Analyze a list of errors and generate summaries with suggestions."""
-        # Group by category
-        by_category = defaultdict(list)
-        for error in errors:
-            by_category[error.error_category].append(error)
-
-        # Group by tool
-        by_tool = defaultdict(lambda: defaultdict(int))
+        # Group by category, by tool, and by subcategory within each category
+        # in a single pass over the errors
+        category_examples: defaultdict[str, list[str]] = defaultdict(list)
+        category_counts: Counter[str] = Counter()
+        by_tool: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        tool_totals: Counter[str] = Counter()
+        subcategory_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        subcategory_examples: dict[tuple[str, str], str] = {}
         for error in errors:
-            by_tool[error.tool_name][error.error_category] += 1
-
-        # Group by subcategory within each category
-        subcategories = defaultdict(lambda: defaultdict(list))
-        for error in errors:
-            if error.subcategory:
-                subcategories[error.error_category][error.subcategory].append(error)
+            category = error.error_category
+            examples = category_examples[category]
+            if len(examples) < 5:
+                examples.append(error.error_message[:150])
+            category_counts[category] += 1
+            by_tool[error.tool_name][category] += 1
+            tool_totals[error.tool_name] += 1
+            subcategory = error.subcategory
+            if subcategory:
+                subcategory_counts[category][subcategory] += 1
+                subcategory_examples.setdefault((category, subcategory), error.error_message)
 
         # Build category summaries with subcategories
         category_summaries = []
-        for category, category_errors in sorted(
-            by_category.items(), key=lambda x: -len(x[1])
-        ):
-            cat_info = ERROR_CATEGORIES.get(category, ERROR_CATEGORIES["other"])
-            example_messages = list(
-                set(e.error_message[:150] for e in category_errors[:5])
-            )
+        for category, count in category_counts.most_common():
+            description, suggestion = _CATEGORY_TEXT.get(category, _CATEGORY_TEXT["other"])
+            example_messages = list(set(category_examples[category]))
 
             # Build subcategory breakdown
             subcategory_breakdown = {}
-            if category in subcategories:
-                for subcat, subcat_errors in sorted(
-                    subcategories[category].items(), key=lambda x: -len(x[1])
-                ):
+            if category in subcategory_counts:
+                for subcat, subcat_count in subcategory_counts[category].most_common():
                     subcategory_breakdown[subcat] = {
-                        "count": len(subcat_errors),
-                        "example": subcat_errors[0].error_message[:100] if subcat_errors else None,
+                        "count": subcat_count,
+                        "example": subcategory_examples[(category, subcat)][:100],
                     }
 
             category_summaries.append(
                 {
                     "category": category,
-                    "count": len(category_errors),
-                    "description": cat_info["description"],
-                    "suggestion": cat_info["suggestion"],
+                    "count": count,
+                    "description": description,
+                    "suggestion": suggestion,
                     "example_errors": example_messages,
                     "subcategories": subcategory_breakdown,
                 }
@@ -416,14 +741,12 @@ class ErrorAnalyzer:
 
         # Build tool summaries
         tool_summaries = []
-        for tool_name, categories in sorted(
-            by_tool.items(), key=lambda x: -sum(x[1].values())
-        ):
+        for tool_name, total in tool_totals.most_common():
             tool_summaries.append(
                 {
                     "tool_name": tool_name,
-                    "total_errors": sum(categories.values()),
-                    "by_category": dict(categories),
+                    "total_errors": total,
+                    "by_category": dict(by_tool[tool_name]),
                 }
             )
 
@@ -442,18 +765,17 @@ class ErrorAnalyzer:
         issues = defaultdict(lambda: {"count": 0, "projects": set(), "examples": []})
 
         for error in errors:
+            err_lower = error.error_message.lower()
             tool_input = error.tool_input or {}
-            for issue_type, issue_def in ACTIONABLE_PATTERNS.items():
-                try:
-                    if issue_def["pattern"](error.error_message, tool_input):
-                        issues[issue_type]["count"] += 1
-                        issues[issue_type]["projects"].add(error.project_path)
-                        if len(issues[issue_type]["examples"]) < 3:
-                            issues[issue_type]["examples"].append(
-                                error.error_message[:150]
-                            )
-                except Exception:
-                    continue
+            command = tool_input.get("command") if isinstance(tool_input, dict) else None
+            cmd_lower = command.lower() if isinstance(command, str) else ""
+            for issue_type in _match_actionable(err_lower, cmd_lower):
+                issues[issue_type]["count"] += 1
+                issues[issue_type]["projects"].add(error.project_path)
+                if len(issues[issue_type]["examples"]) < 3:
+                    issues[issue_type]["examples"].append(
+                        error.error_message[:150]
+                    )
 
         # Convert to list
         result = []
@@ -477,22 +799,20 @@ class ErrorAnalyzer:
         project_filter: Optional[str] = None,
     ) -> dict:
         """Get errors grouped by day for the last N days."""
-        from datetime import timezone
-
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        errors = self.get_project_errors(project_filter=project_filter, limit=5000)
+        errors = self.get_project_errors(
+            project_filter=project_filter, limit=5000, since=cutoff
+        )
 
-        # Filter by date and group
+        # Filter by date and group. Timestamps are UTC ISO-8601 strings, so they
+        # compare lexicographically and their first 10 chars are the date.
+        cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
         by_date = defaultdict(list)
         for error in errors:
-            if error.timestamp:
-                try:
-                    dt = datetime.fromisoformat(error.timestamp.replace("Z", "+00:00"))
-                    if dt >= cutoff:
-                        date_str = dt.strftime("%Y-%m-%d")
-                        by_date[date_str].append(error)
-                except (ValueError, TypeError):
-                    continue
+            ts = error.timestamp
+            if not isinstance(ts, str) or ts < cutoff_iso:
+                continue
+            by_date[ts[:10]].append(error)
 
         # Build daily summaries
         daily_summaries = []
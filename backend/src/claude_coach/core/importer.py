@@ -1,13 +1,24 @@
 """Import Claude Code logs into the database."""
 
 import json
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Optional, cast
 
+from sqlalchemy import (
+    ColumnElement, Date, Index, Table, case, delete, func, insert, literal, select, true,
+)
+from sqlalchemy.engine import CursorResult, Row
 from sqlalchemy.orm import Session as DBSession
 
 from claude_coach.models import (
+    Base,
     Session,
     Message,
     ToolUsage,
@@ -19,6 +30,334 @@ from claude_coach.models import (
     init_db,
     get_session_factory,
 )
+from claude_coach.core import jsonl
+
+# Rows per bulk INSERT when writing a session's messages, tool calls, etc.
+INSERT_BATCH_SIZE = 1000
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_NEEDS_Z_FIX = sys.version_info < (3, 11)
+
+# Below this many session files, parsing serially beats starting a process pool
+PARALLEL_MIN_FILES = 4
+
+# Session files handed to a worker process at a time
+PARSE_CHUNK_SIZE = 8
+
+# SQLite settings for the import connection: WAL avoids rewriting a rollback
+# journal on every commit and, with synchronous=NORMAL, fsyncs only at
+# checkpoints; the larger page cache (in KiB when negative) and in-memory temp
+# store keep bulk inserts and index builds off the disk
+IMPORT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": "-200000",
+    "temp_store": "MEMORY",
+}
+
+# Assistant-only Message columns, so user and assistant rows share one key set
+_USER_MESSAGE_NULLS = dict(
+    model=None,
+    input_tokens=None,
+    output_tokens=None,
+    cache_read_tokens=None,
+    cache_creation_tokens=None,
+    cumulative_context_tokens=None,
+)
+
+# Session child tables whose indexes other than session_id are dropped during
+# a forced re-import and rebuilt afterwards
+_BULK_LOAD_TABLES: tuple[Table, ...] = tuple(
+    cast(Table, model.__table__) for model in (ToolUsage, ErrorEvent, SubagentUsage)
+)
+
+# Commit after this many imported sessions, so a failed import keeps earlier
+# work and the pending transaction stays bounded
+COMMIT_EVERY_SESSIONS = 50
+
+
+def _session_day() -> ColumnElement[date]:
+    """SQL expression for the UTC day a session was created on."""
+    return func.date(Session.created_at, type_=Date)
+
+
+# A tool call's (category, mcp_server, skill_name, subagent_type)
+_ToolClass = tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def _classify_tool(tool_name: str, tool_input: dict[str, Any]) -> _ToolClass:
+    """Classify a tool call into category with metadata.
+
+    Returns a (category, mcp_server, skill_name, subagent_type) tuple.
+    """
+    if tool_name == "Skill":
+        return ("skill", None, tool_input.get("skill", "unknown"), None)
+    elif tool_name == "Task":
+        return ("agent", None, None, tool_input.get("subagent_type", "unknown"))
+    return _classify_tool_name(tool_name)
+
+
+@lru_cache(maxsize=4096)
+def _classify_tool_name(tool_name: str) -> _ToolClass:
+    """Classify an MCP or native tool, which depends on its name alone."""
+    if tool_name.startswith("mcp__"):
+        parts = tool_name.split("__")
+        server_name = parts[1] if len(parts) >= 3 else "unknown"
+        return ("mcp", server_name, None, None)
+    return ("native", None, None, None)
+
+
+def _parse_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
+    """Parse ISO timestamp string."""
+    if not timestamp_str:
+        return None
+    try:
+        if _NEEDS_Z_FIX and timestamp_str[-1] == "Z":
+            timestamp_str = timestamp_str[:-1] + "+00:00"
+        return datetime.fromisoformat(timestamp_str)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _parse_session_chunk(session_files: list[Path]) -> list[dict[str, Any]]:
+    """Parse several session files in one worker call."""
+    return [_parse_session_file(session_file) for session_file in session_files]
+
+
+def _parse_session_file(session_file: Path) -> dict[str, Any]:
+    """Parse a session file into Session column values and child row mappings.
+
+    Returns a dict with "session" (Session column values) and "messages",
+    "tool_usages", "errors" and "subagent_usages" (lists of row mappings
+    without session_id). Lives at module level so it can run in a worker
+    process.
+    """
+    # Row mappings for bulk insertion
+    messages: list[dict[str, Any]] = []
+    tool_usages: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    subagent_usages: list[dict[str, Any]] = []
+
+    # Track subagent tool_use_ids to match with completion results
+    pending_subagents: dict[str, dict[str, Any]] = {}  # tool_use_id → subagent row
+
+    total_input = 0
+    total_output = 0
+    total_cache_read = 0
+    total_cache_create = 0
+    first_prompt = None
+    first_timestamp = None
+    last_timestamp = None
+    project_path = ""
+    git_branch = ""
+    cli_version = ""
+    slug = ""
+    message_index = 0
+    cumulative_tokens = 0
+    subagent_count = 0
+    skill_count = 0
+    timestamp_str = timestamp = None
+
+    # Bind per-line callables to locals; global and attribute lookups add up
+    loads = jsonl.loads
+    parse_timestamp = _parse_timestamp
+    classify_tool = _classify_tool
+    preview = jsonl.preview
+
+    with open(session_file, "rb") as f:
+        for line in f:
+            # Blank lines fail to decode and are skipped with the rest
+            try:
+                event = loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            event_type = event.get("type")
+            # Consecutive events often share a timestamp; reuse the parse
+            event_timestamp = event.get("timestamp")
+            if event_timestamp != timestamp_str:
+                timestamp_str = event_timestamp
+                timestamp = parse_timestamp(timestamp_str)
+
+            if timestamp:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                last_timestamp = timestamp
+
+            # Extract project info and metadata
+            if not project_path and event.get("cwd"):
+                project_path = event.get("cwd", "")
+            if not git_branch and event.get("gitBranch"):
+                git_branch = event.get("gitBranch", "")
+            if not cli_version and event.get("version"):
+                cli_version = event.get("version", "")
+            if not slug and event.get("slug"):
+                slug = event.get("slug", "")
+
+            if event_type == "user":
+                msg = event.get("message", {})
+                content = msg.get("content", "")
+
+                if isinstance(content, str):
+                    if first_prompt is None and content:
+                        first_prompt = content[:500]  # Truncate
+
+                    messages.append(dict(
+                        role="user",
+                        content=content[:10000],  # Truncate long content
+                        timestamp=timestamp,
+                        message_index=message_index,
+                        **_USER_MESSAGE_NULLS,
+                    ))
+                    message_index += 1
+
+                elif isinstance(content, list):
+                    # Tool results - check for subagent completion
+                    for item in content:
+                        if item.get("type") == "tool_result":
+                            tool_use_id = item.get("tool_use_id")
+                            # Check if this is a subagent result via toolUseResult
+                            tool_result = event.get("toolUseResult", {})
+                            if isinstance(tool_result, dict) and tool_result.get("agentId"):
+                                # This is a Task completion result
+                                if tool_use_id and tool_use_id in pending_subagents:
+                                    agent = pending_subagents[tool_use_id]
+                                    agent["agent_id"] = tool_result.get("agentId")
+                                    agent["status"] = tool_result.get("status", "completed")
+                                    agent["duration_ms"] = tool_result.get("totalDurationMs")
+                                    agent["total_tokens"] = tool_result.get("totalTokens")
+                                    agent["total_tool_use_count"] = tool_result.get("totalToolUseCount")
+
+            elif event_type == "assistant":
+                msg = event.get("message", {})
+                usage = msg.get("usage", {})
+
+                input_tokens = usage.get("input_tokens", 0)
+                output_tokens = usage.get("output_tokens", 0)
+                cache_read = usage.get("cache_read_input_tokens", 0)
+                cache_create = usage.get("cache_creation_input_tokens", 0)
+
+                total_input += input_tokens
+                total_output += output_tokens
+                total_cache_read += cache_read
+                total_cache_create += cache_create
+                cumulative_tokens = input_tokens + cache_read
+
+                # Extract text content and tool calls
+                content_parts = msg.get("content", [])
+                text_parts = []
+                text_length = 0
+                for part in content_parts:
+                    part_type = part.get("type")
+                    if part_type == "text":
+                        # Text past the stored 10000 chars is never joined
+                        if text_length < 10000:
+                            text = part.get("text", "")
+                            text_parts.append(text)
+                            text_length += len(text)
+                    elif part_type == "tool_use":
+                        tool_name = part.get("name", "unknown")
+                        tool_input = part.get("input", {})
+                        tool_use_id = part.get("id")
+
+                        # Classify the tool
+                        category, mcp_server, skill_name, subagent_type = classify_tool(
+                            tool_name, tool_input
+                        )
+
+                        tool_usage = dict(
+                            tool_name=tool_name,
+                            tool_use_id=tool_use_id,
+                            timestamp=timestamp,
+                            input_preview=preview(tool_input, 500),
+                            category=category,
+                            mcp_server=mcp_server,
+                            skill_name=skill_name,
+                            subagent_type=subagent_type,
+                        )
+                        tool_usages.append(tool_usage)
+
+                        # Track skills
+                        if category == "skill":
+                            skill_count += 1
+
+                        # Create SubagentUsage for Task tools
+                        if category == "agent":
+                            subagent_count += 1
+                            subagent = dict(
+                                subagent_type=subagent_type or "unknown",
+                                description=str(tool_input.get("description", ""))[:512],
+                                prompt_preview=str(tool_input.get("prompt", ""))[:500],
+                                model=tool_input.get("model"),
+                                timestamp=timestamp,
+                                tool_use_id=tool_use_id,
+                                agent_id=None,
+                                status=None,
+                                duration_ms=None,
+                                total_tokens=None,
+                                total_tool_use_count=None,
+                            )
+                            subagent_usages.append(subagent)
+                            # Track for completion matching
+                            if tool_use_id:
+                                pending_subagents[tool_use_id] = subagent
+
+                text_content = "".join(text_parts)
+                if text_content:
+                    messages.append(dict(
+                        role="assistant",
+                        content=text_content[:10000],
+                        timestamp=timestamp,
+                        model=msg.get("model"),
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        cache_read_tokens=cache_read,
+                        cache_creation_tokens=cache_create,
+                        cumulative_context_tokens=cumulative_tokens,
+                        message_index=message_index,
+                    ))
+                    message_index += 1
+
+            elif event_type == "system" and event.get("subtype") == "api_error":
+                error_data = event.get("error", {}).get("error", {})
+                errors.append(dict(
+                    error_type=error_data.get("type", "unknown"),
+                    error_message=error_data.get("message"),
+                    timestamp=timestamp,
+                    retry_attempt=event.get("retryAttempt"),
+                    retry_in_ms=int(event.get("retryInMs", 0)) if event.get("retryInMs") else None,
+                ))
+
+    # Calculate duration
+    duration_ms = None
+    if first_timestamp and last_timestamp:
+        duration_ms = int((last_timestamp - first_timestamp).total_seconds() * 1000)
+
+    return {
+        "session": dict(
+            project_path=project_path,
+            first_prompt=first_prompt,
+            git_branch=git_branch,
+            created_at=first_timestamp or datetime.utcnow(),
+            modified_at=last_timestamp,
+            message_count=len(messages),
+            total_input_tokens=total_input,
+            total_output_tokens=total_output,
+            total_cache_read_tokens=total_cache_read,
+            total_cache_creation_tokens=total_cache_create,
+            tool_call_count=len(tool_usages),
+            error_count=len(errors),
+            duration_ms=duration_ms,
+            subagent_count=subagent_count,
+            skill_count=skill_count,
+            cli_version=cli_version or None,
+            slug=slug or None,
+        ),
+        "messages": messages,
+        "tool_usages": tool_usages,
+        "errors": errors,
+        "subagent_usages": subagent_usages,
+    }
 
 
 class LogImporter:
@@ -33,11 +372,14 @@ class LogImporter:
 
         # Initialize database
         init_db(db_path)
-        self.session_factory = get_session_factory(db_path)
+        self.session_factory = get_session_factory(db_path, pragmas=IMPORT_PRAGMAS)
 
     def import_all(self, force: bool = False) -> dict:
         """Import all sessions from Claude Code logs.
 
+        Without force, a session already in the database is re-imported only
+        if its file's mtime or size changed since it was imported.
+
         Args:
             force: If True, re-import sessions even if they exist.
 
@@ -54,419 +396,278 @@ class LogImporter:
         }
 
         with self.session_factory() as db:
-            for project_dir in self._get_project_dirs():
-                # Import top-level JSONL files (legacy format)
-                for session_file in project_dir.glob("*.jsonl"):
-                    if session_file.name == "sessions-index.json":
-                        continue
-
-                    session_id = session_file.stem
-                    self._maybe_import_session(db, session_file, session_id, force, stats)
+            # One query up front instead of a lookup per session file. Sessions
+            # imported before fingerprints were recorded map to None and are
+            # treated as up to date.
+            imported = {
+                session_id: None if mtime_ns is None else (mtime_ns, size)
+                for session_id, mtime_ns, size in db.execute(
+                    select(Session.session_id, Session.file_mtime_ns, Session.file_size)
+                )
+            }
 
-                # Import session subdirectories (new format: <session-id>/<session-id>.jsonl)
-                for subdir in project_dir.iterdir():
-                    if not subdir.is_dir():
+            # Re-create any secondary index left dropped by an interrupted import
+            bulk_load_indexes = self._bulk_load_indexes()
+            for index in bulk_load_indexes:
+                index.create(db.connection(), checkfirst=True)
+
+            # Decide what to import first, so parsing can run in parallel
+            pending = []
+            queued = set()
+            replaced = []
+            for session_file, session_id in self._iter_session_files():
+                # A second file for the same session in this run is skipped
+                if session_id in queued:
+                    stats["sessions_skipped"] += 1
+                    continue
+                stat = session_file.stat()
+                fingerprint = (stat.st_mtime_ns, stat.st_size)
+                if session_id in imported:
+                    previous = imported[session_id]
+                    if not force and (previous is None or previous == fingerprint):
+                        stats["sessions_skipped"] += 1
                         continue
-                    session_id = subdir.name
-                    # Look for main session file inside the directory
-                    for session_file in subdir.glob("*.jsonl"):
-                        # Skip subagent files
-                        if session_file.name.startswith("agent-"):
-                            continue
-                        if (subdir / "subagents").is_dir() and session_file.parent == subdir:
-                            self._maybe_import_session(db, session_file, session_id, force, stats)
-                            break
-                    else:
-                        # Also handle case where main JSONL is directly in subdir
-                        main_file = subdir / f"{session_id}.jsonl"
-                        if main_file.exists():
-                            self._maybe_import_session(db, main_file, session_id, force, stats)
-
-            # Update aggregated stats
-            self._update_daily_stats(db)
+                    replaced.append(session_id)
+                queued.add(session_id)
+                pending.append((session_file, session_id, fingerprint))
+
+            # Building indexes once beats updating them per row when rewriting
+            # everything; session_id indexes stay for deleting replaced sessions
+            if force:
+                for index in bulk_load_indexes:
+                    index.drop(db.connection())
+
+            # Days whose stats rows need recomputing
+            affected_days = self._delete_sessions(db, replaced)
+
+            parsed_sessions = self._parse_sessions([f for f, _, _ in pending])
+            for (_, session_id, fingerprint), parsed in zip(pending, parsed_sessions):
+                self._store_session(db, session_id, parsed, fingerprint)
+                affected_days.add(parsed["session"]["created_at"].date())
+                stats["sessions_imported"] += 1
+                stats["messages_imported"] += len(parsed["messages"])
+                stats["tool_usages_imported"] += len(parsed["tool_usages"])
+                stats["errors_imported"] += len(parsed["errors"])
+                stats["subagents_imported"] += len(parsed["subagent_usages"])
+                if stats["sessions_imported"] % COMMIT_EVERY_SESSIONS == 0:
+                    # Keep committed stats consistent with committed sessions
+                    self._update_daily_stats(db, affected_days)
+                    affected_days = set()
+                    db.commit()
+
+            if force:
+                for index in bulk_load_indexes:
+                    index.create(db.connection())
+
+            # Update aggregated stats; a forced import rebuilds them all
+            self._update_daily_stats(db, None if force else affected_days)
             db.commit()
 
+            # Refresh planner statistics so analytics pick the composite indexes
+            if stats["sessions_imported"]:
+                db.connection().exec_driver_sql("PRAGMA optimize")
+
         return stats
 
-    def _maybe_import_session(
-        self, db: DBSession, session_file: Path, session_id: str,
-        force: bool, stats: dict
-    ) -> None:
-        """Import a session if not already imported."""
-        if not force:
-            existing = db.query(Session).filter(
-                Session.session_id == session_id
-            ).first()
-            if existing:
-                stats["sessions_skipped"] += 1
-                return
-
-        result = self._import_session(db, session_file, session_id)
-        stats["sessions_imported"] += 1
-        stats["messages_imported"] += result["messages"]
-        stats["tool_usages_imported"] += result["tool_usages"]
-        stats["errors_imported"] += result["errors"]
-        stats["subagents_imported"] += result["subagents"]
+    def _bulk_load_indexes(self) -> list[Index]:
+        """Indexes on session child tables not used while importing."""
+        return [
+            index
+            for table in _BULK_LOAD_TABLES
+            for index in table.indexes
+            if "session_id" not in index.columns
+        ]
 
     def _get_project_dirs(self) -> list[Path]:
         """Get all project directories."""
         if not self.projects_dir.exists():
             return []
-        return [d for d in self.projects_dir.iterdir() if d.is_dir()]
+        with os.scandir(self.projects_dir) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_dir()]
 
-    def _classify_tool(self, tool_name: str, tool_input: dict) -> dict:
-        """Classify a tool call into category with metadata.
+    def _iter_session_files(self) -> Iterator[tuple[Path, str]]:
+        """Yield (session file, session ID) for every main session log.
 
-        Returns dict with: category, mcp_server, skill_name, subagent_type
+        Directories are listed with os.scandir, whose entries know their type
+        without a stat call per file.
         """
-        if tool_name == "Skill":
-            return {
-                "category": "skill",
-                "mcp_server": None,
-                "skill_name": tool_input.get("skill", "unknown"),
-                "subagent_type": None,
-            }
-        elif tool_name == "Task":
-            return {
-                "category": "agent",
-                "mcp_server": None,
-                "skill_name": None,
-                "subagent_type": tool_input.get("subagent_type", "unknown"),
-            }
-        elif tool_name.startswith("mcp__"):
-            parts = tool_name.split("__")
-            server_name = parts[1] if len(parts) >= 3 else "unknown"
-            return {
-                "category": "mcp",
-                "mcp_server": server_name,
-                "skill_name": None,
-                "subagent_type": None,
-            }
-        else:
-            return {
-                "category": "native",
-                "mcp_server": None,
-                "skill_name": None,
-                "subagent_type": None,
-            }
-
-    def _import_session(
-        self, db: DBSession, session_file: Path, session_id: str
-    ) -> dict:
-        """Import a single session."""
-        stats = {"messages": 0, "tool_usages": 0, "errors": 0, "subagents": 0}
-
-        # Parse session file
-        messages = []
-        tool_usages = []
-        errors = []
-        subagent_usages = []
-
-        # Track subagent tool_use_ids to match with completion results
-        pending_subagents: dict[str, SubagentUsage] = {}  # tool_use_id → SubagentUsage
-
-        total_input = 0
-        total_output = 0
-        total_cache_read = 0
-        total_cache_create = 0
-        first_prompt = None
-        first_timestamp = None
-        last_timestamp = None
-        project_path = ""
-        git_branch = ""
-        cli_version = ""
-        slug = ""
-        message_index = 0
-        cumulative_tokens = 0
-        subagent_count = 0
-        skill_count = 0
-
-        with open(session_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    event = json.loads(line)
-                except json.JSONDecodeError:
+        for project_dir in self._get_project_dirs():
+            with os.scandir(project_dir) as it:
+                entries = list(it)
+
+            # Top-level JSONL files (legacy format)
+            for entry in entries:
+                if entry.name.endswith(".jsonl") and entry.is_file():
+                    yield Path(entry.path), entry.name.removesuffix(".jsonl")
+
+            # Session subdirectories (new format: <session-id>/<session-id>.jsonl)
+            for subdir in entries:
+                if not subdir.is_dir():
                     continue
+                session_id = subdir.name
+                with os.scandir(subdir.path) as it:
+                    children = list(it)
+                # Skip subagent files
+                session_files = [
+                    child for child in children
+                    if child.name.endswith(".jsonl") and not child.name.startswith("agent-")
+                ]
+                has_subagents = any(
+                    child.name == "subagents" and child.is_dir() for child in children
+                )
+                if has_subagents and session_files:
+                    # Main session file alongside the subagents directory
+                    yield Path(session_files[0].path), session_id
+                else:
+                    # Also handle case where main JSONL is directly in subdir
+                    main_name = f"{session_id}.jsonl"
+                    if any(child.name == main_name for child in session_files):
+                        yield Path(subdir.path) / main_name, session_id
+
+    def _parse_sessions(self, session_files: list[Path]) -> Iterator[dict[str, Any]]:
+        """Parse session files, yielding results in input order."""
+        if len(session_files) < PARALLEL_MIN_FILES:
+            for session_file in session_files:
+                yield _parse_session_file(session_file)
+            return
+
+        # Parsing is CPU-bound and independent per file; the caller writes the
+        # results to SQLite serially as they arrive. Only a bounded window of
+        # chunks is in flight, so parsed sessions don't pile up in memory
+        # while the writes lag behind
+        workers = os.cpu_count() or 1
+        chunks = [
+            session_files[start:start + PARSE_CHUNK_SIZE]
+            for start in range(0, len(session_files), PARSE_CHUNK_SIZE)
+        ]
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending: deque[Future[list[dict[str, Any]]]] = deque()
+            next_chunk = 0
+            while pending or next_chunk < len(chunks):
+                while next_chunk < len(chunks) and len(pending) < 2 * workers:
+                    pending.append(executor.submit(_parse_session_chunk, chunks[next_chunk]))
+                    next_chunk += 1
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _delete_sessions(self, db: DBSession, session_ids: list[str]) -> set[date]:
+        """Delete sessions and their child rows, a batch of IDs per statement.
+
+        Returns the days the deleted sessions were created on.
+        """
+        days: set[date] = set()
+        # Bulk deletes do not cascade, and SQLite can hand a freed primary key
+        # to the next session, so child rows are deleted explicitly
+        for start in range(0, len(session_ids), INSERT_BATCH_SIZE):
+            batch = session_ids[start:start + INSERT_BATCH_SIZE]
+            days.update(db.scalars(
+                select(_session_day()).where(Session.session_id.in_(batch)).distinct()
+            ))
+            session_pks = select(Session.id).where(Session.session_id.in_(batch))
+            for model in (Message, ToolUsage, ErrorEvent, SubagentUsage):
+                db.execute(delete(model).where(model.session_id.in_(session_pks)))
+            db.execute(delete(Session).where(Session.session_id.in_(batch)))
+        return days
+
+    def _store_session(
+        self, db: DBSession, session_id: str, parsed: dict[str, Any],
+        fingerprint: Optional[tuple[int, int]] = None,
+    ) -> None:
+        """Write a parsed session that is not in the database.
 
-                event_type = event.get("type")
-                timestamp_str = event.get("timestamp")
-                timestamp = self._parse_timestamp(timestamp_str)
-
-                if timestamp:
-                    if first_timestamp is None:
-                        first_timestamp = timestamp
-                    last_timestamp = timestamp
-
-                # Extract project info and metadata
-                if not project_path and event.get("cwd"):
-                    project_path = event.get("cwd", "")
-                if not git_branch and event.get("gitBranch"):
-                    git_branch = event.get("gitBranch", "")
-                if not cli_version and event.get("version"):
-                    cli_version = event.get("version", "")
-                if not slug and event.get("slug"):
-                    slug = event.get("slug", "")
-
-                if event_type == "user":
-                    msg = event.get("message", {})
-                    content = msg.get("content", "")
-
-                    if isinstance(content, str):
-                        if first_prompt is None and content:
-                            first_prompt = content[:500]  # Truncate
-
-                        messages.append(Message(
-                            role="user",
-                            content=content[:10000],  # Truncate long content
-                            timestamp=timestamp,
-                            message_index=message_index,
-                        ))
-                        message_index += 1
-
-                    elif isinstance(content, list):
-                        # Tool results - check for subagent completion
-                        for item in content:
-                            if item.get("type") == "tool_result":
-                                tool_use_id = item.get("tool_use_id")
-                                # Check if this is a subagent result via toolUseResult
-                                tool_result = event.get("toolUseResult", {})
-                                if isinstance(tool_result, dict) and tool_result.get("agentId"):
-                                    # This is a Task completion result
-                                    if tool_use_id and tool_use_id in pending_subagents:
-                                        agent = pending_subagents[tool_use_id]
-                                        agent.agent_id = tool_result.get("agentId")
-                                        agent.status = tool_result.get("status", "completed")
-                                        agent.duration_ms = tool_result.get("totalDurationMs")
-                                        agent.total_tokens = tool_result.get("totalTokens")
-                                        agent.total_tool_use_count = tool_result.get("totalToolUseCount")
-
-                elif event_type == "assistant":
-                    msg = event.get("message", {})
-                    usage = msg.get("usage", {})
-
-                    input_tokens = usage.get("input_tokens", 0)
-                    output_tokens = usage.get("output_tokens", 0)
-                    cache_read = usage.get("cache_read_input_tokens", 0)
-                    cache_create = usage.get("cache_creation_input_tokens", 0)
-
-                    total_input += input_tokens
-                    total_output += output_tokens
-                    total_cache_read += cache_read
-                    total_cache_create += cache_create
-                    cumulative_tokens = input_tokens + cache_read
-
-                    # Extract text content and tool calls
-                    content_parts = msg.get("content", [])
-                    text_content = ""
-                    for part in content_parts:
-                        if part.get("type") == "text":
-                            text_content += part.get("text", "")
-                        elif part.get("type") == "tool_use":
-                            tool_name = part.get("name", "unknown")
-                            tool_input = part.get("input", {})
-                            tool_use_id = part.get("id")
-
-                            # Classify the tool
-                            classification = self._classify_tool(tool_name, tool_input)
-
-                            tool_usage = ToolUsage(
-                                tool_name=tool_name,
-                                tool_use_id=tool_use_id,
-                                timestamp=timestamp,
-                                input_preview=str(tool_input)[:500],
-                                category=classification["category"],
-                                mcp_server=classification["mcp_server"],
-                                skill_name=classification["skill_name"],
-                                subagent_type=classification["subagent_type"],
-                            )
-                            tool_usages.append(tool_usage)
-                            stats["tool_usages"] += 1
-
-                            # Track skills
-                            if classification["category"] == "skill":
-                                skill_count += 1
-
-                            # Create SubagentUsage for Task tools
-                            if classification["category"] == "agent":
-                                subagent_count += 1
-                                subagent = SubagentUsage(
-                                    subagent_type=classification["subagent_type"] or "unknown",
-                                    description=str(tool_input.get("description", ""))[:512],
-                                    prompt_preview=str(tool_input.get("prompt", ""))[:500],
-                                    model=tool_input.get("model"),
-                                    timestamp=timestamp,
-                                    tool_use_id=tool_use_id,
-                                )
-                                subagent_usages.append(subagent)
-                                stats["subagents"] += 1
-                                # Track for completion matching
-                                if tool_use_id:
-                                    pending_subagents[tool_use_id] = subagent
-
-                    if text_content:
-                        messages.append(Message(
-                            role="assistant",
-                            content=text_content[:10000],
-                            timestamp=timestamp,
-                            model=msg.get("model"),
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            cache_read_tokens=cache_read,
-                            cache_creation_tokens=cache_create,
-                            cumulative_context_tokens=cumulative_tokens,
-                            message_index=message_index,
-                        ))
-                        message_index += 1
-
-                elif event_type == "system" and event.get("subtype") == "api_error":
-                    error_data = event.get("error", {}).get("error", {})
-                    errors.append(ErrorEvent(
-                        error_type=error_data.get("type", "unknown"),
-                        error_message=error_data.get("message"),
-                        timestamp=timestamp,
-                        retry_attempt=event.get("retryAttempt"),
-                        retry_in_ms=int(event.get("retryInMs", 0)) if event.get("retryInMs") else None,
-                    ))
-                    stats["errors"] += 1
-
-        # Calculate duration
-        duration_ms = None
-        if first_timestamp and last_timestamp:
-            duration_ms = int((last_timestamp - first_timestamp).total_seconds() * 1000)
-
-        # Create session
-        session = Session(
+        fingerprint is the file's (mtime_ns, size), stored on the session.
+        """
+        # Bulk INSERT statements skip ORM instance construction and the identity
+        # map. The new id is the cursor's lastrowid rather than a RETURNING
+        # clause, which SQLite only supports from 3.35.
+        result = cast(CursorResult[Any], db.execute(insert(Session).values(
             session_id=session_id,
-            project_path=project_path,
-            first_prompt=first_prompt,
-            git_branch=git_branch,
-            created_at=first_timestamp or datetime.utcnow(),
-            modified_at=last_timestamp,
-            message_count=len(messages),
-            total_input_tokens=total_input,
-            total_output_tokens=total_output,
-            total_cache_read_tokens=total_cache_read,
-            total_cache_creation_tokens=total_cache_create,
-            tool_call_count=len(tool_usages),
-            error_count=len(errors),
-            duration_ms=duration_ms,
-            subagent_count=subagent_count,
-            skill_count=skill_count,
-            cli_version=cli_version or None,
-            slug=slug or None,
-        )
-
-        # Delete existing if force re-import
-        db.query(Session).filter(Session.session_id == session_id).delete()
-
-        db.add(session)
-        db.flush()  # Get session.id
+            file_mtime_ns=fingerprint[0] if fingerprint else None,
+            file_size=fingerprint[1] if fingerprint else None,
+            **parsed["session"],
+        )))
+        # Always set for a single-row INSERT; None only for executemany and the like
+        session_pk = cast(Row[Any], result.inserted_primary_key)[0]
 
         # Add messages, tools, errors, subagents
-        for msg in messages:
-            msg.session_id = session.id
-            db.add(msg)
-            stats["messages"] += 1
+        self._bulk_insert(db, Message, parsed["messages"], session_pk)
+        self._bulk_insert(db, ToolUsage, parsed["tool_usages"], session_pk)
+        self._bulk_insert(db, ErrorEvent, parsed["errors"], session_pk)
+        self._bulk_insert(db, SubagentUsage, parsed["subagent_usages"], session_pk)
 
-        for tool in tool_usages:
-            tool.session_id = session.id
-            db.add(tool)
-
-        for error in errors:
-            error.session_id = session.id
-            db.add(error)
-
-        for subagent in subagent_usages:
-            subagent.session_id = session.id
-            db.add(subagent)
-
-        return stats
+    def _bulk_insert(
+        self, db: DBSession, model: type[Base], rows: list[dict[str, Any]], session_pk: int,
+    ) -> None:
+        """Insert child rows of a session in batches of INSERT_BATCH_SIZE.
 
-    def _parse_timestamp(self, timestamp_str: Optional[str]) -> Optional[datetime]:
-        """Parse ISO timestamp string."""
-        if not timestamp_str:
-            return None
-        try:
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            return None
-
-    def _update_daily_stats(self, db: DBSession):
-        """Update daily aggregated statistics."""
-        # Get all sessions grouped by date
-        sessions = db.query(Session).all()
-
-        daily_data = {}
-        tool_data = {}
-        error_data = {}
-
-        for session in sessions:
-            date_key = session.created_at.date()
-
-            # Daily stats
-            if date_key not in daily_data:
-                daily_data[date_key] = {
-                    "session_count": 0,
-                    "message_count": 0,
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "cache_read_tokens": 0,
-                    "cache_creation_tokens": 0,
-                    "tool_call_count": 0,
-                    "error_count": 0,
-                }
-
-            daily_data[date_key]["session_count"] += 1
-            daily_data[date_key]["message_count"] += session.message_count
-            daily_data[date_key]["input_tokens"] += session.total_input_tokens
-            daily_data[date_key]["output_tokens"] += session.total_output_tokens
-            daily_data[date_key]["cache_read_tokens"] += session.total_cache_read_tokens
-            daily_data[date_key]["cache_creation_tokens"] += session.total_cache_creation_tokens
-            daily_data[date_key]["tool_call_count"] += session.tool_call_count
-            daily_data[date_key]["error_count"] += session.error_count
-
-            # Tool stats
-            for tool in session.tool_usages:
-                tool_key = (date_key, tool.tool_name)
-                if tool_key not in tool_data:
-                    tool_data[tool_key] = {"count": 0, "errors": 0, "duration": 0}
-                tool_data[tool_key]["count"] += 1
-                if tool.is_error:
-                    tool_data[tool_key]["errors"] += 1
-                if tool.duration_ms:
-                    tool_data[tool_key]["duration"] += tool.duration_ms
-
-            # Error stats
-            for error in session.errors:
-                error_key = (date_key, error.error_type)
-                if error_key not in error_data:
-                    error_data[error_key] = {"count": 0}
-                error_data[error_key]["count"] += 1
+        Rows go through a bulk executemany, so every row of a table must have
+        the same keys.
+        """
+        for row in rows:
+            row["session_id"] = session_pk
+        statement = insert(model)
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            db.execute(statement, rows[start:start + INSERT_BATCH_SIZE])
+
+    def _update_daily_stats(self, db: DBSession, days: Optional[set[date]] = None) -> None:
+        """Recompute daily aggregated statistics from the imported sessions.
+
+        Only the given days are recomputed, or every day when days is None.
+        Each table is recomputed with one INSERT ... SELECT ... GROUP BY, so
+        rows are aggregated in the database rather than loaded into Python.
+        """
+        if days is not None and not days:
+            return
+        day = _session_day()
 
         # Clear existing stats and insert new
-        db.query(DailyStats).delete()
-        db.query(ToolStats).delete()
-        db.query(ErrorStats).delete()
-
-        for date_key, data in daily_data.items():
-            db.add(DailyStats(date=date_key, project_path="*", **data))
-
-        for (date_key, tool_name), data in tool_data.items():
-            db.add(ToolStats(
-                date=date_key,
-                tool_name=tool_name,
-                call_count=data["count"],
-                error_count=data["errors"],
-                total_duration_ms=data["duration"],
-            ))
-
-        for (date_key, error_type), data in error_data.items():
-            db.add(ErrorStats(
-                date=date_key,
-                error_type=error_type,
-                count=data["count"],
-            ))
+        in_days = day.in_(days) if days is not None else true()
+        for model in (DailyStats, ToolStats, ErrorStats):
+            query = db.query(model)
+            if days is not None:
+                query = query.filter(model.date.in_(days))
+            query.delete()
+
+        db.execute(insert(DailyStats).from_select(
+            [
+                "date", "project_path", "session_count", "message_count",
+                "input_tokens", "output_tokens", "cache_read_tokens",
+                "cache_creation_tokens", "tool_call_count", "error_count",
+            ],
+            select(
+                day,
+                literal("*"),
+                func.count(),
+                func.sum(Session.message_count),
+                func.sum(Session.total_input_tokens),
+                func.sum(Session.total_output_tokens),
+                func.sum(Session.total_cache_read_tokens),
+                func.sum(Session.total_cache_creation_tokens),
+                func.sum(Session.tool_call_count),
+                func.sum(Session.error_count),
+            ).where(in_days).group_by(day),
+        ))
+
+        db.execute(insert(ToolStats).from_select(
+            ["date", "tool_name", "call_count", "error_count", "total_duration_ms"],
+            select(
+                day,
+                ToolUsage.tool_name,
+                func.count(),
+                func.count(case((ToolUsage.is_error, 1))),
+                func.coalesce(func.sum(ToolUsage.duration_ms), 0),
+            )
+            .join(Session, ToolUsage.session_id == Session.id)
+            .where(in_days)
+            .group_by(day, ToolUsage.tool_name),
+        ))
+
+        db.execute(insert(ErrorStats).from_select(
+            ["date", "error_type", "count"],
+            select(day, ErrorEvent.error_type, func.count())
+            .join(Session, ErrorEvent.session_id == Session.id)
+            .where(in_days)
+            .group_by(day, ErrorEvent.error_type),
+        ))
@@ -1,14 +1,17 @@
 """Generate insights and recommendations from usage patterns."""
 
-from dataclasses import dataclass
-from typing import Optional
+import json
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from typing import Any, Optional
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from claude_coach.models import Session, ToolUsage, ErrorEvent, Message, SubagentUsage
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Insight:
     """A single insight or recommendation."""
 
@@ -20,14 +23,118 @@ class Insight:
     metric_label: Optional[str] = None
 
 
+@dataclass(slots=True)
+class _CacheEntry:
+    """Insights generated for one data revision, and their JSON once built."""
+
+    revision: tuple[Any, ...]
+    insights: list[Insight]
+    json: Optional[bytes] = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ToolCount:
+    """Calls grouped by tool category, name, skill and MCP server."""
+
+    category: Optional[str]
+    tool_name: str
+    skill_name: Optional[str]
+    mcp_server: Optional[str]
+    calls: int
+
+
+# Last insights per database URL
+_insights_cache: dict[str, _CacheEntry] = {}
+
+# The only query run on every call; built once (SQLAlchemy caches its compiled SQL)
+_REVISION_QUERY = select(func.count(), func.max(Session.imported_at)).select_from(Session)
+
+
 class InsightsEngine:
     """Generate insights from usage data."""
 
     def __init__(self, db: DBSession):
         self.db = db
 
+    @staticmethod
+    def invalidate() -> None:
+        """Drop cached insights, e.g. after writing to the database directly."""
+        _insights_cache.clear()
+
+    def _data_revision(self) -> tuple[Any, ...]:
+        """Cheap probe that changes whenever sessions are imported or removed.
+
+        Child rows are only written together with their session, and every
+        (re-)import stamps a new imported_at, so ids alone are not used: SQLite
+        may hand a replaced session its old id back.
+        """
+        return tuple(self.db.execute(_REVISION_QUERY).one())
+
+    @cached_property
+    def _session_totals(self) -> Row[Any]:
+        """Session count, token and error sums, and averages in one query."""
+        return self.db.execute(select(
+            func.count().label("sessions"),
+            func.sum(Session.total_cache_read_tokens).label("cache_read"),
+            func.sum(Session.total_cache_creation_tokens).label("cache_create"),
+            func.sum(Session.total_input_tokens).label("input"),
+            func.sum(Session.total_output_tokens).label("output"),
+            func.sum(Session.error_count).label("errors"),
+            func.avg(Session.message_count).label("avg_messages"),
+            # Sessions without a (nonzero) duration are left out of the average
+            func.avg(func.nullif(Session.duration_ms, 0)).label("avg_duration_ms"),
+        )).one()
+
+    @cached_property
+    def _tool_usage_counts(self) -> list[_ToolCount]:
+        """Call counts per tool, skill and MCP server, shared by the tool insights."""
+        return [_ToolCount(*row) for row in self.db.execute(
+            select(
+                ToolUsage.category,
+                ToolUsage.tool_name,
+                ToolUsage.skill_name,
+                ToolUsage.mcp_server,
+                func.count(),
+            ).group_by(
+                ToolUsage.category, ToolUsage.tool_name, ToolUsage.skill_name, ToolUsage.mcp_server
+            )
+        )]
+
+    def _count_tool_usages(self, key: str, category: Optional[str] = None) -> dict[str, int]:
+        """Sum tool call counts by a column, optionally for one category."""
+        counts: dict[str, int] = {}
+        for row in self._tool_usage_counts:
+            if category is None or row.category == category:
+                name = getattr(row, key)
+                counts[name] = counts.get(name, 0) + row.calls
+        return counts
+
     def generate_all_insights(self) -> list[Insight]:
-        """Generate all available insights."""
+        """Generate all available insights.
+
+        Results are reused until the data revision changes.
+        """
+        return list(self._cache_entry().insights)
+
+    def generate_all_insights_json(self) -> bytes:
+        """All insights as a JSON array, serialized once per data revision."""
+        entry = self._cache_entry()
+        if entry.json is None:
+            entry.json = json.dumps([asdict(i) for i in entry.insights]).encode()
+        return entry.json
+
+    def _cache_entry(self) -> _CacheEntry:
+        """Cache entry for the current data revision, generating insights if stale."""
+        url = str(self.db.get_bind().engine.url)
+        revision = self._data_revision()
+        entry = _insights_cache.get(url)
+        if entry is None or entry.revision != revision:
+            entry = _CacheEntry(revision, self._generate_insights())
+            _insights_cache[url] = entry
+        return entry
+
+    def _generate_insights(self) -> list[Insight]:
+        """Run every insight generator."""
         insights = []
 
         insights.extend(self._efficiency_insights())
@@ -44,13 +151,13 @@ class InsightsEngine:
         """Generate efficiency-related insights."""
         insights = []
 
-        sessions = self.db.query(Session).all()
-        if not sessions:
+        totals = self._session_totals
+        if not totals.sessions:
             return insights
 
         # Cache hit rate analysis
-        total_cache_read = sum(s.total_cache_read_tokens for s in sessions)
-        total_cache_create = sum(s.total_cache_creation_tokens for s in sessions)
+        total_cache_read = totals.cache_read
+        total_cache_create = totals.cache_create
         total_cache = total_cache_read + total_cache_create
 
         if total_cache > 0:
@@ -82,8 +189,8 @@ class InsightsEngine:
                 ))
 
         # Token efficiency
-        total_input = sum(s.total_input_tokens for s in sessions)
-        total_output = sum(s.total_output_tokens for s in sessions)
+        total_input = totals.input
+        total_output = totals.output
 
         if total_input > 0:
             output_ratio = total_output / total_input
@@ -108,17 +215,18 @@ class InsightsEngine:
         insights = []
 
         # Get tool usage stats
-        tool_counts = (
-            self.db.query(ToolUsage.tool_name, func.count(ToolUsage.id).label("count"))
-            .group_by(ToolUsage.tool_name)
-            .all()
-        )
+        tool_dict = self._count_tool_usages("tool_name")
 
-        if not tool_counts:
+        if not tool_dict:
             return insights
 
-        tool_dict = {name: count for name, count in tool_counts}
-        total_tools = sum(tool_dict.values())
+        # Total and most used tool in one pass
+        total_tools = 0
+        top_tool = ("", 0)
+        for name, count in tool_dict.items():
+            total_tools += count
+            if count > top_tool[1]:
+                top_tool = (name, count)
 
         # Check for underutilized tools
         underutilized = []
@@ -154,7 +262,6 @@ class InsightsEngine:
             ))
 
         # Identify most productive tools
-        top_tool = max(tool_dict.items(), key=lambda x: x[1])
         insights.append(Insight(
             category="tools",
             title=f"Most Used Tool: {top_tool[0]}",
@@ -170,23 +277,23 @@ class InsightsEngine:
         """Generate error-related insights."""
         insights = []
 
-        sessions = self.db.query(Session).all()
-        if not sessions:
+        totals = self._session_totals
+        if not totals.sessions:
             return insights
 
-        total_sessions = len(sessions)
-        total_errors = sum(s.error_count for s in sessions)
+        total_sessions = totals.sessions
+        total_errors = totals.errors
 
         error_rate = total_errors / total_sessions if total_sessions > 0 else 0
 
         if error_rate > 1:
             # Get most common error type
-            error_counts = (
-                self.db.query(ErrorEvent.error_type, func.count(ErrorEvent.id))
+            error_counts = self.db.execute(
+                select(ErrorEvent.error_type, func.count())
                 .group_by(ErrorEvent.error_type)
-                .order_by(func.count(ErrorEvent.id).desc())
-                .first()
-            )
+                .order_by(func.count().desc())
+                .limit(1)
+            ).first()
 
             if error_counts:
                 insights.append(Insight(
@@ -214,13 +321,12 @@ class InsightsEngine:
         """Generate workflow pattern insights."""
         insights = []
 
-        sessions = self.db.query(Session).all()
-        if not sessions:
+        totals = self._session_totals
+        if not totals.sessions:
             return insights
 
         # Session length analysis
-        session_lengths = [s.message_count for s in sessions]
-        avg_length = sum(session_lengths) / len(session_lengths)
+        avg_length = totals.avg_messages
 
         if avg_length > 50:
             insights.append(Insight(
@@ -248,9 +354,8 @@ class InsightsEngine:
             ))
 
         # Duration analysis
-        durations = [s.duration_ms for s in sessions if s.duration_ms]
-        if durations:
-            avg_duration_min = (sum(durations) / len(durations)) / 60000
+        if totals.avg_duration_ms is not None:
+            avg_duration_min = totals.avg_duration_ms / 60000
 
             if avg_duration_min > 30:
                 insights.append(Insight(
@@ -271,12 +376,20 @@ class InsightsEngine:
         """Generate insights about subagent usage patterns."""
         insights = []
 
-        total_sessions = self.db.query(Session).count()
+        total_sessions = self._session_totals.sessions
         if total_sessions == 0:
             return insights
 
-        # Count total agent spawns
-        total_agents = self.db.query(SubagentUsage).count()
+        # Spawns and token totals per agent type, in one query
+        type_stats = self.db.execute(
+            select(
+                SubagentUsage.subagent_type,
+                func.count(),
+                func.sum(SubagentUsage.total_tokens),
+                func.count(SubagentUsage.total_tokens),
+            ).group_by(SubagentUsage.subagent_type)
+        ).all()
+        total_agents = sum(count for _, count, _, _ in type_stats)
 
         if total_agents == 0:
             insights.append(Insight(
@@ -308,12 +421,7 @@ class InsightsEngine:
         ))
 
         # Check for general-purpose overuse
-        type_counts = (
-            self.db.query(SubagentUsage.subagent_type, func.count(SubagentUsage.id))
-            .group_by(SubagentUsage.subagent_type)
-            .all()
-        )
-        type_dict = {t: c for t, c in type_counts}
+        type_dict = {t: c for t, c, _, _ in type_stats}
         general_count = type_dict.get("general-purpose", 0)
 
         if general_count > total_agents * 0.5 and total_agents > 5:
@@ -332,12 +440,10 @@ class InsightsEngine:
             ))
 
         # Check agent token efficiency
-        agents_with_tokens = self.db.query(SubagentUsage).filter(
-            SubagentUsage.total_tokens.isnot(None)
-        ).all()
+        with_tokens = sum(n for _, _, _, n in type_stats)
 
-        if agents_with_tokens:
-            avg_tokens = sum(a.total_tokens for a in agents_with_tokens) / len(agents_with_tokens)
+        if with_tokens:
+            avg_tokens = sum(tokens or 0 for _, _, tokens, _ in type_stats) / with_tokens
             if avg_tokens > 50000:
                 insights.append(Insight(
                     category="agents",
@@ -358,11 +464,8 @@ class InsightsEngine:
         """Generate insights about skill usage."""
         insights = []
 
-        total_skills = (
-            self.db.query(ToolUsage)
-            .filter(ToolUsage.category == "skill")
-            .count()
-        )
+        skill_dict = self._count_tool_usages("skill_name", category="skill")
+        total_skills = sum(skill_dict.values())
 
         if total_skills == 0:
             insights.append(Insight(
@@ -380,13 +483,7 @@ class InsightsEngine:
             ))
         else:
             # Get skill names
-            skill_counts = (
-                self.db.query(ToolUsage.skill_name, func.count(ToolUsage.id))
-                .filter(ToolUsage.category == "skill")
-                .group_by(ToolUsage.skill_name)
-                .order_by(func.count(ToolUsage.id).desc())
-                .all()
-            )
+            skill_counts = sorted(skill_dict.items(), key=lambda x: x[1], reverse=True)
 
             skill_names = [name for name, _ in skill_counts if name]
             top_skill = skill_counts[0] if skill_counts else None
@@ -411,13 +508,8 @@ class InsightsEngine:
         insights = []
 
         # Count MCP tool usage
-        mcp_tools = (
-            self.db.query(ToolUsage.mcp_server, func.count(ToolUsage.id).label("count"))
-            .filter(ToolUsage.category == "mcp")
-            .group_by(ToolUsage.mcp_server)
-            .order_by(func.count(ToolUsage.id).desc())
-            .all()
-        )
+        mcp_dict = self._count_tool_usages("mcp_server", category="mcp")
+        mcp_tools = sorted(mcp_dict.items(), key=lambda x: x[1], reverse=True)
 
         total_mcp = sum(count for _, count in mcp_tools)
 
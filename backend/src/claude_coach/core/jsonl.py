@@ -0,0 +1,31 @@
+"""JSON decoding for Claude Code JSONL logs."""
+
+import json
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (pip install -e ".[fast]")
+    orjson = None
+
+# Decode one JSONL line (str or bytes). orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch json.JSONDecodeError either way.
+loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def preview(obj: Any, limit: int) -> str:
+    """Serialize obj as compact JSON and truncate it to at most limit characters.
+
+    With orjson the bytes are cut before decoding, so a large payload is never
+    decoded in full; a multi-byte character split by the cut is dropped.
+    """
+    try:
+        if orjson is not None:
+            data: bytes = orjson.dumps(obj)
+            return data[:limit].decode("utf-8", "ignore")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))[:limit]
+    except (TypeError, ValueError):  # not JSON-serializable
+        return str(obj)[:limit]
@@ -2,12 +2,46 @@
 
 import json
 import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Optional
 from datetime import datetime
 
+from claude_coach.core import jsonl
 from claude_coach.schemas.session import Session, SessionDetail, Message, PlanModeStats
 
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_NEEDS_Z_FIX = sys.version_info < (3, 11)
+
+# Parsed sessions-index.json entries and JSONL first prompts, kept across
+# LogParser instances (routes build one per request) and reused while the
+# file's (mtime_ns, size) is unchanged
+_index_cache: dict[Path, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
+_first_prompt_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+
+# Session ID -> JSONL path per projects directory, also kept across LogParser
+# instances; rebuilt from the indexes when an ID misses or its file moved
+_session_paths: dict[Path, dict[str, Path]] = {}
+
+# How far into a session file to look for its first prompt; sessions whose
+# opening user message is further in are listed without one
+FIRST_PROMPT_SCAN_BYTES = 256 * 1024
+
+# Parse state of the most recently read session files, oldest first. Routes
+# run in a threadpool, so a state is popped under the lock and only one thread
+# feeds or reads it until it is put back
+SESSION_CACHE_SIZE = 32
+_session_cache: "OrderedDict[Path, tuple[tuple[int, int], _SessionParse]]" = OrderedDict()
+_session_cache_lock = threading.Lock()
+
+
+def _fingerprint(stat: os.stat_result) -> tuple[int, int]:
+    """Identify a file version by modification time and size."""
+    return (stat.st_mtime_ns, stat.st_size)
+
 
 class LogParser:
     """Parse Claude Code log files."""
@@ -23,20 +57,96 @@ class LogParser:
         """Get all project directories."""
         if not self.projects_dir.exists():
             return []
-        return [d for d in self.projects_dir.iterdir() if d.is_dir()]
+        with os.scandir(self.projects_dir) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_dir()]
 
     def _parse_sessions_index(self, project_dir: Path) -> list[dict]:
         """Parse sessions-index.json for a project."""
         index_file = project_dir / "sessions-index.json"
-        if not index_file.exists():
+        try:
+            fingerprint = _fingerprint(index_file.stat())
+        except OSError:
             return []
+        cached = _index_cache.get(index_file)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
 
         try:
-            with open(index_file) as f:
-                data = json.load(f)
-                return data.get("entries", [])
+            with open(index_file, "rb") as f:
+                data = jsonl.loads(f.read())
+                entries = data.get("entries", [])
         except (json.JSONDecodeError, IOError):
             return []
+        _index_cache[index_file] = (fingerprint, entries)
+        return entries
+
+    def _first_prompt(self, session_file: Path, stat: os.stat_result) -> str:
+        """First user prompt of a session file, truncated to 200 characters."""
+        fingerprint = _fingerprint(stat)
+        cached = _first_prompt_cache.get(session_file)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        first_prompt = ""
+        scanned = 0
+        with open(session_file, "rb") as f:
+            for line in f:
+                if scanned >= FIRST_PROMPT_SCAN_BYTES:
+                    break
+                scanned += len(line)
+                try:
+                    event = jsonl.loads(line)
+                    if event.get("type") == "user":
+                        msg = event.get("message", {})
+                        content = msg.get("content", "")
+                        if isinstance(content, str) and content:
+                            first_prompt = content[:200]
+                            break
+                except json.JSONDecodeError:
+                    continue
+        _first_prompt_cache[session_file] = (fingerprint, first_prompt)
+        return first_prompt
+
+    def _build_session_paths(self) -> dict[str, Path]:
+        """Map session IDs to JSONL paths from every sessions-index.json."""
+        paths = {}
+        for project_dir in self._get_project_dirs():
+            for entry in self._parse_sessions_index(project_dir):
+                session_id = entry.get("sessionId")
+                if not session_id:
+                    continue
+                full_path = entry.get("fullPath")
+                paths[session_id] = (
+                    Path(full_path) if full_path else project_dir / f"{session_id}.jsonl"
+                )
+        return paths
+
+    def _session_path(self, session_id: str) -> Optional[Path]:
+        """Resolve the JSONL file for a session.
+
+        Known sessions cost one lookup and one exists() check. On a miss the
+        map is rebuilt from the sessions-index.json files, whose parses are
+        reused unless an index changed, and only then is every project
+        directory probed for sessions no index knows about.
+        """
+        paths = _session_paths.get(self.projects_dir)
+        if paths is not None:
+            session_file = paths.get(session_id)
+            if session_file is not None and session_file.exists():
+                return session_file
+
+        paths = self._build_session_paths()
+        _session_paths[self.projects_dir] = paths
+        session_file = paths.get(session_id)
+        if session_file is not None and session_file.exists():
+            return session_file
+
+        for project_dir in self._get_project_dirs():
+            session_file = project_dir / f"{session_id}.jsonl"
+            if session_file.exists():
+                paths[session_id] = session_file
+                return session_file
+        return None
 
     def list_sessions(
         self,
@@ -72,33 +182,33 @@ class LogParser:
                         git_branch=entry.get("gitBranch"),
                     ))
 
-            # Also discover sessions directly from JSONL files
-            for session_file in project_dir.glob("*.jsonl"):
-                session_id = session_file.stem
+            # Also discover sessions directly from JSONL files; scandir entries
+            # know their type, so only the matching files are stat'ed
+            try:
+                with os.scandir(project_dir) as it:
+                    jsonl_entries: list[os.DirEntry[str]] = [
+                        dir_entry for dir_entry in it
+                        if dir_entry.name.endswith(".jsonl") and not dir_entry.name.startswith(".")
+                    ]
+            except OSError:
+                continue
+            for dir_entry in jsonl_entries:
+                session_id = dir_entry.name.removesuffix(".jsonl")
                 if session_id in seen_session_ids:
                     continue
                 seen_session_ids.add(session_id)
 
                 # Get basic info from file stats and first line
                 try:
-                    stat = session_file.stat()
+                    if not dir_entry.is_file():
+                        continue
+                    session_file = Path(dir_entry.path)
+                    stat = dir_entry.stat()
                     created = datetime.fromtimestamp(stat.st_ctime).isoformat()
                     modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
 
                     # Try to get first prompt from file
-                    first_prompt = ""
-                    with open(session_file) as f:
-                        for line in f:
-                            try:
-                                event = json.loads(line)
-                                if event.get("type") == "user":
-                                    msg = event.get("message", {})
-                                    content = msg.get("content", "")
-                                    if isinstance(content, str) and content:
-                                        first_prompt = content[:200]
-                                        break
-                            except json.JSONDecodeError:
-                                continue
+                    first_prompt = self._first_prompt(session_file, stat)
 
                     # Derive project path from directory name
                     project_path = str(project_dir.name).replace("-", "/")
@@ -123,197 +233,287 @@ class LogParser:
 
     def get_session(self, session_id: str) -> Optional[SessionDetail]:
         """Get detailed session information."""
-        for project_dir in self._get_project_dirs():
-            session_file = project_dir / f"{session_id}.jsonl"
-            if session_file.exists():
-                return self._parse_session_file(session_file, session_id)
-        return None
+        session_file = self._session_path(session_id)
+        if session_file is None:
+            return None
+        return self._parse_session_file(session_file, session_id)
 
     def _parse_timestamp(self, ts: Optional[str]) -> Optional[datetime]:
         """Parse ISO timestamp string to datetime."""
         if not ts:
             return None
         try:
-            # Handle various ISO formats
-            ts = ts.replace("Z", "+00:00")
+            if _NEEDS_Z_FIX and ts[-1] == "Z":
+                ts = ts[:-1] + "+00:00"
             return datetime.fromisoformat(ts)
         except (ValueError, TypeError):
             return None
 
     def _parse_session_file(self, session_file: Path, session_id: str) -> SessionDetail:
-        """Parse a session JSONL file."""
-        messages = []
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cache_read = 0
-        total_cache_create = 0
-        tool_calls = []
-        errors = []
+        """Parse a session JSONL file.
 
-        # Plan mode tracking
-        # Plan mode starts when writing to ~/.claude/plans/ and ends with ExitPlanMode
-        in_plan_mode = False
-        plan_mode_start: Optional[datetime] = None
-        plan_mode_entries = 0
-        planning_time_seconds = 0.0
-        execution_time_seconds = 0.0
-        planning_tokens = 0
-        execution_tokens = 0
-        planning_messages = 0
-        execution_messages = 0
-        last_timestamp: Optional[datetime] = None
-        first_timestamp: Optional[datetime] = None
-
-        with open(session_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    event = json.loads(line)
-                    event_type = event.get("type")
-                    timestamp = self._parse_timestamp(event.get("timestamp"))
-
-                    # Track first timestamp for session duration
-                    if timestamp and first_timestamp is None:
-                        first_timestamp = timestamp
+        Session logs are only ever appended to, so the parse state of recently
+        read files is kept and a file that grew only has its new lines parsed.
+        """
+        with open(session_file, "rb") as f:
+            stat = os.fstat(f.fileno())
+            fingerprint = _fingerprint(stat)
+            # Popped while parsing, so a failed parse leaves no partial state
+            with _session_cache_lock:
+                cached = _session_cache.pop(session_file, None)
+            if cached is not None and cached[0] == fingerprint:
+                state = cached[1]
+            else:
+                if cached is not None and cached[1].resumable and stat.st_size > cached[0][1]:
+                    state = cached[1]
+                    f.seek(state.offset)
+                else:
+                    state = _SessionParse()
+                state.feed(f, self._parse_timestamp)
+
+        # Built before the state is shared again, so it reflects this parse only
+        detail = state.detail(session_id)
+        with _session_cache_lock:
+            _session_cache[session_file] = (fingerprint, state)
+            while len(_session_cache) > SESSION_CACHE_SIZE:
+                _session_cache.popitem(last=False)
+        return detail
 
-                    if event_type == "user":
-                        msg = event.get("message", {})
-                        content = msg.get("content", "")
+    def get_session_messages(
+        self,
+        session_id: str,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Optional[list[Message]]:
+        """Get messages for a session."""
+        session = self.get_session(session_id)
+        if session is None:
+            return None
+        return session.messages[offset:offset + limit]
 
-                        # Check for tool_result containing plan file creation
-                        if isinstance(content, list):
-                            for part in content:
-                                if part.get("type") == "tool_result":
-                                    tool_result = event.get("toolUseResult", {})
-                                    if isinstance(tool_result, dict):
-                                        file_path = tool_result.get("filePath", "")
-                                        # Detect plan file creation - this marks start of plan mode
-                                        if "/.claude/plans/" in file_path and tool_result.get("type") == "create":
-                                            if not in_plan_mode:
-                                                in_plan_mode = True
-                                                plan_mode_start = timestamp
-                                                plan_mode_entries += 1
-
-                        if isinstance(content, str):
-                            messages.append(Message(
-                                role="user",
-                                content=content,
-                                timestamp=event.get("timestamp"),
-                            ))
-                            # Count messages by mode
-                            if in_plan_mode:
-                                planning_messages += 1
-                            else:
-                                execution_messages += 1
-
-                    elif event_type == "assistant":
-                        msg = event.get("message", {})
-                        usage = msg.get("usage", {})
 
-                        msg_tokens = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
-                        total_input_tokens += usage.get("input_tokens", 0)
-                        total_output_tokens += usage.get("output_tokens", 0)
-                        total_cache_read += usage.get("cache_read_input_tokens", 0)
-                        total_cache_create += usage.get("cache_creation_input_tokens", 0)
+class _SessionParse:
+    """Running totals of a session file parse, resumable after appended lines."""
 
-                        # Track tokens by mode
-                        if in_plan_mode:
-                            planning_tokens += msg_tokens
-                            planning_messages += 1
-                        else:
-                            execution_tokens += msg_tokens
-                            execution_messages += 1
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
+        self.total_cache_read = 0
+        self.total_cache_create = 0
+        self.tool_call_count = 0
+        self.error_count = 0
 
-                        content_parts = msg.get("content", [])
-                        text_content = ""
-                        for part in content_parts:
-                            if part.get("type") == "text":
-                                text_content += part.get("text", "")
-                            elif part.get("type") == "tool_use":
-                                tool_name = part.get("name", "")
-                                tool_calls.append({
-                                    "name": tool_name,
-                                    "timestamp": event.get("timestamp"),
-                                })
-
-                                # Detect plan mode start from Write tool to plans directory
-                                if tool_name == "Write":
-                                    tool_input = part.get("input", {})
-                                    file_path = tool_input.get("file_path", "")
-                                    if "/.claude/plans/" in file_path:
+        # Plan mode tracking
+        # Plan mode starts when writing to ~/.claude/plans/ and ends with ExitPlanMode
+        self.in_plan_mode = False
+        self.plan_mode_start: Optional[datetime] = None
+        self.plan_mode_entries = 0
+        self.planning_time_seconds = 0.0
+        self.planning_tokens = 0
+        self.execution_tokens = 0
+        self.planning_messages = 0
+        self.execution_messages = 0
+        self.last_timestamp: Optional[datetime] = None
+        self.first_timestamp: Optional[datetime] = None
+
+        # Bytes of complete lines consumed, where a resumed parse continues
+        self.offset = 0
+        self.resumable = True
+
+    def feed(
+        self, f: BinaryIO, parse_timestamp: Callable[[Optional[str]], Optional[datetime]]
+    ) -> None:
+        """Parse lines from the current position of f to its end."""
+        # The loop works on locals, written back once it finishes. Messages
+        # are built with model_construct: every field is taken from the event
+        # as-is, so per-message validation would only repeat type checks
+        messages = self.messages
+        tool_call_count = self.tool_call_count
+        error_count = self.error_count
+        total_input_tokens = self.total_input_tokens
+        total_output_tokens = self.total_output_tokens
+        total_cache_read = self.total_cache_read
+        total_cache_create = self.total_cache_create
+        in_plan_mode = self.in_plan_mode
+        plan_mode_start = self.plan_mode_start
+        plan_mode_entries = self.plan_mode_entries
+        planning_time_seconds = self.planning_time_seconds
+        planning_tokens = self.planning_tokens
+        execution_tokens = self.execution_tokens
+        planning_messages = self.planning_messages
+        execution_messages = self.execution_messages
+        last_timestamp = self.last_timestamp
+        first_timestamp = self.first_timestamp
+        offset = self.offset
+        resumable = self.resumable
+
+        # Binary line iteration is the fastest read path measured for these
+        # logs; loads takes the bytes as-is, and blank lines fail to
+        # decode and are skipped like any other malformed line
+        loads = jsonl.loads
+        timestamp_str = timestamp = None
+        for line in f:
+            if line[-1:] == b"\n":
+                offset += len(line)
+            else:
+                # A line still being written; resuming after it could
+                # count it twice, so the next change reparses the file
+                resumable = False
+            try:
+                event = loads(line)
+                event_type = event.get("type")
+                # Consecutive events often share a timestamp; reuse the parse
+                event_timestamp = event.get("timestamp")
+                if event_timestamp != timestamp_str:
+                    timestamp_str = event_timestamp
+                    timestamp = parse_timestamp(timestamp_str)
+
+                # Track first timestamp for session duration
+                if timestamp and first_timestamp is None:
+                    first_timestamp = timestamp
+
+                if event_type == "user":
+                    msg = event.get("message", {})
+                    content = msg.get("content", "")
+
+                    # Check for tool_result containing plan file creation
+                    if isinstance(content, list):
+                        for part in content:
+                            if part.get("type") == "tool_result":
+                                tool_result = event.get("toolUseResult", {})
+                                if isinstance(tool_result, dict):
+                                    file_path = tool_result.get("filePath", "")
+                                    # Detect plan file creation - this marks start of plan mode
+                                    if "/.claude/plans/" in file_path and tool_result.get("type") == "create":
                                         if not in_plan_mode:
                                             in_plan_mode = True
                                             plan_mode_start = timestamp
                                             plan_mode_entries += 1
 
-                                # Detect plan mode end
-                                elif tool_name == "ExitPlanMode":
-                                    if in_plan_mode and plan_mode_start and timestamp:
-                                        planning_time_seconds += (timestamp - plan_mode_start).total_seconds()
-                                        in_plan_mode = False
-                                        plan_mode_start = None
-
-                        if text_content:
-                            messages.append(Message(
-                                role="assistant",
-                                content=text_content,
-                                timestamp=event.get("timestamp"),
-                                model=msg.get("model"),
-                                input_tokens=usage.get("input_tokens"),
-                                output_tokens=usage.get("output_tokens"),
-                            ))
-
-                    elif event_type == "system" and event.get("subtype") == "api_error":
-                        errors.append({
-                            "error": event.get("error", {}),
-                            "timestamp": event.get("timestamp"),
-                        })
-
-                    # Update last timestamp
-                    if timestamp:
-                        last_timestamp = timestamp
+                    if isinstance(content, str):
+                        messages.append(Message.model_construct(
+                            role="user",
+                            content=content,
+                            timestamp=event.get("timestamp"),
+                        ))
+                        # Count messages by mode
+                        if in_plan_mode:
+                            planning_messages += 1
+                        else:
+                            execution_messages += 1
 
-                except json.JSONDecodeError:
-                    continue
+                elif event_type == "assistant":
+                    msg = event.get("message", {})
+                    usage = msg.get("usage", {})
+
+                    msg_tokens = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+                    total_input_tokens += usage.get("input_tokens", 0)
+                    total_output_tokens += usage.get("output_tokens", 0)
+                    total_cache_read += usage.get("cache_read_input_tokens", 0)
+                    total_cache_create += usage.get("cache_creation_input_tokens", 0)
+
+                    # Track tokens by mode
+                    if in_plan_mode:
+                        planning_tokens += msg_tokens
+                        planning_messages += 1
+                    else:
+                        execution_tokens += msg_tokens
+                        execution_messages += 1
+
+                    content_parts = msg.get("content", [])
+                    text_content = ""
+                    for part in content_parts:
+                        part_type = part.get("type")
+                        if part_type == "text":
+                            text_content += part.get("text", "")
+                        elif part_type == "tool_use":
+                            tool_name = part.get("name", "")
+                            tool_call_count += 1
+
+                            # Detect plan mode start from Write tool to plans directory
+                            if tool_name == "Write":
+                                tool_input = part.get("input", {})
+                                file_path = tool_input.get("file_path", "")
+                                if "/.claude/plans/" in file_path:
+                                    if not in_plan_mode:
+                                        in_plan_mode = True
+                                        plan_mode_start = timestamp
+                                        plan_mode_entries += 1
+
+                            # Detect plan mode end
+                            elif tool_name == "ExitPlanMode":
+                                if in_plan_mode and plan_mode_start and timestamp:
+                                    planning_time_seconds += (timestamp - plan_mode_start).total_seconds()
+                                    in_plan_mode = False
+                                    plan_mode_start = None
+
+                    if text_content:
+                        messages.append(Message.model_construct(
+                            role="assistant",
+                            content=text_content,
+                            timestamp=event.get("timestamp"),
+                            model=msg.get("model"),
+                            input_tokens=usage.get("input_tokens"),
+                            output_tokens=usage.get("output_tokens"),
+                        ))
+
+                elif event_type == "system" and event.get("subtype") == "api_error":
+                    error_count += 1
+
+                # Update last timestamp
+                if timestamp:
+                    last_timestamp = timestamp
+
+            except json.JSONDecodeError:
+                continue
 
+        self.tool_call_count = tool_call_count
+        self.error_count = error_count
+        self.total_input_tokens = total_input_tokens
+        self.total_output_tokens = total_output_tokens
+        self.total_cache_read = total_cache_read
+        self.total_cache_create = total_cache_create
+        self.in_plan_mode = in_plan_mode
+        self.plan_mode_start = plan_mode_start
+        self.plan_mode_entries = plan_mode_entries
+        self.planning_time_seconds = planning_time_seconds
+        self.planning_tokens = planning_tokens
+        self.execution_tokens = execution_tokens
+        self.planning_messages = planning_messages
+        self.execution_messages = execution_messages
+        self.last_timestamp = last_timestamp
+        self.first_timestamp = first_timestamp
+        self.offset = offset
+        self.resumable = resumable
+
+    def detail(self, session_id: str) -> SessionDetail:
+        """Build the session detail from the totals so far."""
         # Calculate execution time as total session time minus planning time
-        if first_timestamp and last_timestamp:
-            total_session_time = (last_timestamp - first_timestamp).total_seconds()
-            execution_time_seconds = max(0, total_session_time - planning_time_seconds)
+        execution_time_seconds = 0.0
+        if self.first_timestamp and self.last_timestamp:
+            total_session_time = (self.last_timestamp - self.first_timestamp).total_seconds()
+            execution_time_seconds = max(0, total_session_time - self.planning_time_seconds)
 
         # Create plan mode stats
         plan_mode_stats = PlanModeStats(
-            planning_time_seconds=planning_time_seconds,
+            planning_time_seconds=self.planning_time_seconds,
             execution_time_seconds=execution_time_seconds,
-            planning_tokens=planning_tokens,
-            execution_tokens=execution_tokens,
-            planning_messages=planning_messages,
-            execution_messages=execution_messages,
-            plan_mode_entries=plan_mode_entries,
+            planning_tokens=self.planning_tokens,
+            execution_tokens=self.execution_tokens,
+            planning_messages=self.planning_messages,
+            execution_messages=self.execution_messages,
+            plan_mode_entries=self.plan_mode_entries,
         )
 
         return SessionDetail(
             session_id=session_id,
-            messages=messages,
-            total_input_tokens=total_input_tokens,
-            total_output_tokens=total_output_tokens,
-            total_cache_read_tokens=total_cache_read,
-            total_cache_creation_tokens=total_cache_create,
-            tool_call_count=len(tool_calls),
-            error_count=len(errors),
+            messages=list(self.messages),
+            total_input_tokens=self.total_input_tokens,
+            total_output_tokens=self.total_output_tokens,
+            total_cache_read_tokens=self.total_cache_read,
+            total_cache_creation_tokens=self.total_cache_create,
+            tool_call_count=self.tool_call_count,
+            error_count=self.error_count,
             plan_mode_stats=plan_mode_stats,
         )
-
-    def get_session_messages(
-        self,
-        session_id: str,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> Optional[list[Message]]:
-        """Get messages for a session."""
-        session = self.get_session(session_id)
-        if session is None:
-            return None
-        return session.messages[offset:offset + limit]
@@ -1,12 +1,19 @@
 """Database configuration and session management."""
 
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.pool import ConnectionPoolEntry
 
 # Default to SQLite in user's home directory
 DEFAULT_DB_PATH = Path.home() / ".claude-coach" / "claude_coach.db"
 
+# Sync API routes run in FastAPI's threadpool (40 threads by default); a
+# smaller pool makes requests queue for a connection. SQLite connections are
+# cheap, so keep one per worker thread.
+POOL_SIZE = 40
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -21,19 +28,36 @@ def get_database_url(db_path: Path | None = None) -> str:
     return f"sqlite:///{db_path}"
 
 
-def create_db_engine(db_path: Path | None = None):
-    """Create database engine."""
+def create_db_engine(
+    db_path: Path | None = None, pragmas: dict[str, str] | None = None
+) -> Engine:
+    """Create database engine.
+
+    pragmas are SQLite PRAGMA settings applied to every new connection.
+    """
     url = get_database_url(db_path)
-    return create_engine(url, echo=False)
+    engine = create_engine(url, echo=False, pool_size=POOL_SIZE)
+    if pragmas:
+        @event.listens_for(engine, "connect")
+        def _set_pragmas(
+            dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+        ) -> None:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+    return engine
 
 
-def get_session_factory(db_path: Path | None = None):
+def get_session_factory(
+    db_path: Path | None = None, pragmas: dict[str, str] | None = None
+) -> sessionmaker[Session]:
     """Get a session factory."""
-    engine = create_db_engine(db_path)
+    engine = create_db_engine(db_path, pragmas)
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def init_db(db_path: Path | None = None):
+def init_db(db_path: Path | None = None) -> Engine:
     """Initialize the database, creating all tables."""
     engine = create_db_engine(db_path)
     Base.metadata.create_all(bind=engine)
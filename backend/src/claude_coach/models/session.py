@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import String, Integer, BigInteger, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from claude_coach.models.database import Base
@@ -45,6 +45,10 @@ class Session(Base):
     cli_version: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     slug: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
 
+    # Source file fingerprint at import time, used to skip unchanged files
+    file_mtime_ns: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
     # Relationships
     messages: Mapped[list["Message"]] = relationship(
         "Message", back_populates="session", cascade="all, delete-orphan"
@@ -94,6 +98,14 @@ class ToolUsage(Base):
     """A tool call within a session."""
 
     __tablename__ = "tool_usages"
+    __table_args__ = (
+        # Covers the insights GROUP BY, which then never reads the wide table rows
+        Index(
+            "ix_tool_usages_category_names", "category", "tool_name", "skill_name", "mcp_server"
+        ),
+        # Skill and MCP analytics filter one category by a date range
+        Index("ix_tool_usages_category_timestamp", "category", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), index=True)
@@ -143,6 +155,10 @@ class SubagentUsage(Base):
     """A subagent spawned via the Task tool during a session."""
 
     __tablename__ = "subagent_usages"
+    __table_args__ = (
+        # Agent analytics filter spawns by a date range
+        Index("ix_subagent_usages_timestamp", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), index=True)
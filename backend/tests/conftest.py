@@ -0,0 +1,18 @@
+"""Shared test fixtures."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from claude_coach.models.database import get_session_factory, init_db
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database session."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        init_db(db_path)
+        with get_session_factory(db_path)() as session:
+            yield session
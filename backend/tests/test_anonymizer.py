@@ -0,0 +1,55 @@
+"""Tests for the metrics anonymizer."""
+
+from datetime import date, datetime
+
+from claude_coach.core.anonymizer import MetricsAnonymizer
+from claude_coach.models import ErrorEvent, Session, ToolUsage
+
+
+def test_no_sessions(db):
+    """Test metrics for a period without sessions."""
+    metrics = MetricsAnonymizer(db).generate_anonymized_metrics(date(2026, 1, 1), date(2026, 1, 31))
+    assert metrics.total_sessions == 0
+    assert metrics.tool_usage == {}
+
+
+def test_aggregates_sessions_in_range(db):
+    """Test that totals, averages and child counts cover only sessions in range."""
+    rows = [
+        ("s0", datetime(2026, 1, 5), 10, 3_600_000),
+        ("s1", datetime(2026, 1, 6), 30, None),
+        ("s2", datetime(2026, 3, 1), 99, 60_000),  # outside the period
+    ]
+    for session_id, created_at, messages, duration_ms in rows:
+        session = Session(
+            session_id=session_id,
+            project_path="/test/project",
+            created_at=created_at,
+            message_count=messages,
+            total_input_tokens=100,
+            total_output_tokens=50,
+            total_cache_read_tokens=300,
+            total_cache_creation_tokens=100,
+            tool_call_count=2,
+            error_count=1,
+            duration_ms=duration_ms,
+        )
+        db.add(session)
+        db.flush()
+        db.add_all([
+            ToolUsage(session_id=session.id, tool_name="Read"),
+            ToolUsage(session_id=session.id, tool_name="Bash"),
+            ErrorEvent(session_id=session.id, error_type="overloaded_error"),
+        ])
+    db.commit()
+
+    metrics = MetricsAnonymizer(db).generate_anonymized_metrics(date(2026, 1, 1), date(2026, 1, 31))
+    assert metrics.total_sessions == 2
+    assert metrics.total_messages == 40
+    assert metrics.avg_messages_per_session == 20
+    assert metrics.avg_session_duration_minutes == 60
+    assert metrics.avg_tokens_per_session == 150
+    assert metrics.cache_hit_rate == 0.75
+    assert metrics.tool_usage == {"Read": 2, "Bash": 2}
+    assert metrics.error_types == {"overloaded_error": 2}
+    assert metrics.total_errors == 2
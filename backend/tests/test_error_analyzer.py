@@ -0,0 +1,269 @@
+"""Tests for the error analyzer."""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from claude_coach.core.error_analyzer import (
+    ErrorAnalyzer,
+    ToolError,
+    _match_actionable,
+    categorize_error,
+    get_subcategory,
+)
+
+SESSION_ID = "5f1e2d3c-4b5a-4968-8776-a5b4c3d2e1f0"
+
+
+def _tool_error(message: str, command: str = "") -> ToolError:
+    """Build a categorized ToolError for a Bash command."""
+    error = ToolError(
+        tool_name="Bash",
+        error_message=message,
+        error_category=categorize_error(message),
+        timestamp=None,
+        session_id=SESSION_ID,
+        project_path="/test/project",
+        tool_input={"command": command},
+    )
+    error.subcategory = get_subcategory(error)
+    return error
+
+
+@pytest.mark.parametrize(
+    "message, category",
+    [
+        ("File does not exist.", "file_not_found"),
+        ("EISDIR: illegal operation on a directory", "directory_instead_of_file"),
+        ("Error: No such tool available: mcp__foo__bar", "tool_not_available"),
+        ("The user doesn't want to proceed with this tool use.", "user_rejected"),
+        ("String to replace not found in file.\nString: old_string", "edit_string_not_found"),
+        ("Found 3 matches of the string to replace, but replace_all is false.",
+         "edit_multiple_matches"),
+        ("File has not been read yet. Read it first before writing to it.",
+         "file_not_read_first"),
+        ("Exit code 1\nsomething broke", "command_failed"),
+        ("Request failed with status code 404", "http_error"),
+        ("File content (30000 tokens) exceeds maximum allowed tokens (25000).",
+         "file_too_large"),
+        ("Error connecting to database: timeout", "database_connection"),
+        ("No workspace set", "mcp_workspace_not_set"),
+        ("[Request interrupted by user for tool use]", "task_interrupted"),
+        ("bash: ./run.sh: Permission denied", "permission_denied"),
+        ("InputValidationError: unexpected parameter", "invalid_input"),
+        ("Something unexpected happened", "other"),
+    ],
+)
+def test_categorize_error(message, category):
+    """Test error categorization by message."""
+    assert categorize_error(message) == category
+
+
+@pytest.mark.parametrize(
+    "message, command, subcategory",
+    [
+        ("Exit code 127\nfoo: command not found", "foo --bar", "command_not_found"),
+        ("Exit code 128\nfatal: not a git repository", "git status", "git_auth_or_branch"),
+        ("Exit code 1\nerror: pathspec", "git checkout nope", "git_error"),
+        ("Exit code 1\n2 failed", "pytest tests/", "test_failure"),
+        ("Exit code 1\nservice postgres is not running", "make db", "service_not_running"),
+        ("Exit code 2\nsomething", "make build", "exit_code_2"),
+    ],
+)
+def test_command_subcategory(message, command, subcategory):
+    """Test subcategories for failed commands."""
+    assert _tool_error(message, command).subcategory == subcategory
+
+
+def test_other_subcategories():
+    """Test subcategories for HTTP and missing-tool errors."""
+    assert _tool_error("Request failed with status code 429").subcategory == "429_rate_limited"
+    assert (
+        _tool_error("Error: No such tool available: mcp__foo__bar").subcategory
+        == "mcp__foo__bar"
+    )
+
+
+@pytest.mark.parametrize(
+    "message, command, issue_types",
+    [
+        ("no such file or directory: .venv/bin/python", "", ["missing_venv"]),
+        ("container web is not running", "docker compose exec web sh",
+         ["docker_not_running"]),
+        ("exit code 128\nfatal: bad revision", "git checkout main", ["git_auth_error"]),
+        ("exit code 1\n2 failed", "pytest tests/", ["test_failures"]),
+        ("exit code 127\nfoo: command not found", "make test",
+         ["test_failures", "command_not_found"]),
+        ("error connecting to database: timeout", "", ["db_connection_failed"]),
+        ("exit code 1\nboom", "make build", []),
+    ],
+)
+def test_match_actionable(message, command, issue_types):
+    """Test actionable issue matching on lowercased message and command."""
+    assert _match_actionable(message, command) == issue_types
+
+
+@pytest.fixture
+def mock_claude_dir():
+    """Create a temporary Claude directory with tool errors in one session."""
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    old = (now - timedelta(days=60)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    def tool_call(tool_id, name, tool_input, timestamp):
+        return {
+            "type": "assistant",
+            "timestamp": timestamp,
+            "message": {"content": [
+                {"type": "tool_use", "id": tool_id, "name": name, "input": tool_input},
+            ]},
+        }
+
+    def tool_result(tool_id, content, is_error=True):
+        return {
+            "type": "user",
+            "message": {"content": [
+                {"type": "tool_result", "tool_use_id": tool_id, "content": content,
+                 "is_error": is_error},
+            ]},
+        }
+
+    events = [
+        tool_call("t1", "Bash", {"command": "git push"}, old),
+        tool_result("t1", "Exit code 128\nfatal: Authentication failed"),
+        tool_call("t2", "Read", {"file_path": "/nope"}, recent),
+        tool_result("t2", "File does not exist."),
+        tool_call("t3", "Edit", {"file_path": "/a.py"}, recent),
+        tool_result("t3", "File has not been read yet. Read it first before writing to it."),
+        tool_call("t4", "Read", {"file_path": "/ok"}, recent),
+        tool_result("t4", "contents", is_error=False),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        claude_dir = Path(tmpdir)
+        project_dir = claude_dir / "projects" / "-test-project"
+        project_dir.mkdir(parents=True)
+        with open(project_dir / f"{SESSION_ID}.jsonl", "w") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+        yield claude_dir
+
+
+def test_get_session_errors(mock_claude_dir):
+    """Test parsing tool errors from a session file."""
+    analyzer = ErrorAnalyzer(mock_claude_dir)
+    errors = analyzer.get_session_errors(SESSION_ID)
+
+    assert errors is not None
+    assert [e.tool_name for e in errors] == ["Bash", "Read", "Edit"]
+    assert errors[0].subcategory == "git_auth_or_branch"
+    assert errors[1].error_category == "file_not_found"
+    assert analyzer.get_session_errors("nonexistent") is None
+
+
+def test_analyze_errors(mock_claude_dir):
+    """Test category, tool and actionable summaries."""
+    analyzer = ErrorAnalyzer(mock_claude_dir)
+    errors = analyzer.get_project_errors()
+    analysis = analyzer.analyze_errors(errors)
+
+    assert analysis["total_errors"] == 3
+    assert {c["category"] for c in analysis["by_category"]} == {
+        "command_failed", "file_not_found", "file_not_read_first",
+    }
+    assert {t["tool_name"]: t["total_errors"] for t in analysis["by_tool"]} == {
+        "Bash": 1, "Read": 1, "Edit": 1,
+    }
+    issues = {i["issue_type"]: i for i in analysis["actionable_issues"]}
+    assert set(issues) == {"git_auth_error", "edit_without_read"}
+    assert issues["git_auth_error"]["projects"] == ["/test/project"]
+
+
+def test_get_errors_by_timeframe(mock_claude_dir):
+    """Test that the timeframe view drops errors older than the cutoff."""
+    analyzer = ErrorAnalyzer(mock_claude_dir)
+    result = analyzer.get_errors_by_timeframe(days=7)
+
+    assert result["total_errors"] == 2
+    assert len(result["daily"]) == 1
+    assert result["daily"][0]["by_category"] == {
+        "file_not_found": 1, "file_not_read_first": 1,
+    }
+
+
+def test_get_project_errors_limit(mock_claude_dir):
+    """Test that scanning stops once limit errors are collected."""
+    analyzer = ErrorAnalyzer(mock_claude_dir)
+    assert len(analyzer.get_project_errors(limit=1)) == 1
+    assert len(analyzer.get_project_errors(limit=2)) == 2
+
+
+def test_get_project_errors_pool(mock_claude_dir, monkeypatch):
+    """Test that the worker-pool path returns the same errors as the serial one."""
+    analyzer = ErrorAnalyzer(mock_claude_dir)
+    serial = analyzer.get_project_errors()
+    serial_limited = analyzer.get_project_errors(limit=1)
+
+    monkeypatch.setattr("claude_coach.core.error_analyzer.PARALLEL_MIN_FILES", 1)
+    assert analyzer.get_project_errors() == serial
+    assert analyzer.get_project_errors(limit=1) == serial_limited
+
+
+def test_error_cache(mock_claude_dir):
+    """Test that cached errors match a fresh parse and are rebuilt on change."""
+    uncached = ErrorAnalyzer(mock_claude_dir)
+    analyzer = ErrorAnalyzer(mock_claude_dir, cache_dir=mock_claude_dir / "error_cache")
+
+    assert analyzer.get_project_errors() == uncached.get_project_errors()
+    assert list(analyzer.cache_dir.glob("*.pickle"))
+    # Warm runs apply limit and cutoff to the cached list
+    assert analyzer.get_project_errors(limit=1) == uncached.get_project_errors(limit=1)
+    assert analyzer.get_errors_by_timeframe(days=7) == uncached.get_errors_by_timeframe(days=7)
+
+    session_file = next(mock_claude_dir.glob("projects/*/*.jsonl"))
+    with open(session_file, "a") as f:
+        f.write(json.dumps({
+            "type": "user",
+            "message": {"content": [{
+                "type": "tool_result",
+                "tool_use_id": "missing",
+                "content": "File does not exist.",
+                "is_error": True,
+            }]},
+        }) + "\n")
+
+    assert len(analyzer.get_project_errors()) == 4
+
+
+def test_error_cache_unreadable_entry(mock_claude_dir):
+    """Test that an entry that cannot be unpickled counts as a cache miss."""
+    uncached = ErrorAnalyzer(mock_claude_dir)
+    analyzer = ErrorAnalyzer(mock_claude_dir, cache_dir=mock_claude_dir / "error_cache")
+    analyzer.get_project_errors()
+
+    # References a module that does not exist, so unpickling raises ImportError
+    cache_file = next(analyzer.cache_dir.glob("*.pickle"))
+    cache_file.write_bytes(b"cmissing_module\nToolError\n.")
+    assert analyzer.get_project_errors() == uncached.get_project_errors()
+
+
+def test_error_cache_prunes_deleted_sessions(mock_claude_dir):
+    """Test that cache entries of deleted session files are removed."""
+    analyzer = ErrorAnalyzer(mock_claude_dir, cache_dir=mock_claude_dir / "error_cache")
+    analyzer.get_project_errors()
+    assert len(list(analyzer.cache_dir.glob("*.pickle"))) == 1
+
+    # Unrelated files and temp files that may still be written are kept
+    (analyzer.cache_dir / "notes.txt").write_text("")
+    (analyzer.cache_dir / "fresh.tmp").write_bytes(b"")
+    stale = analyzer.cache_dir / "stale.tmp"
+    stale.write_bytes(b"")
+    os.utime(stale, (0, 0))
+
+    next(mock_claude_dir.glob("projects/*/*.jsonl")).unlink()
+    assert analyzer.get_project_errors() == []
+    assert sorted(p.name for p in analyzer.cache_dir.iterdir()) == ["fresh.tmp", "notes.txt"]
@@ -0,0 +1,288 @@
+"""Tests for the log importer."""
+
+import json
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect, text
+
+from claude_coach.core.importer import LogImporter
+from claude_coach.models import (
+    DailyStats,
+    ErrorEvent,
+    ErrorStats,
+    Message,
+    Session,
+    SubagentUsage,
+    ToolStats,
+    ToolUsage,
+)
+
+SESSION_ID = "0b7d2c1e-8f4a-4e7b-9c1d-2a3b4c5d6e7f"
+
+
+@pytest.fixture
+def mock_claude_dir():
+    """Create a temporary Claude directory with one session log."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        claude_dir = Path(tmpdir) / "claude"
+        project_dir = claude_dir / "projects" / "-test-project"
+        project_dir.mkdir(parents=True)
+
+        session_events = [
+            {
+                "type": "user",
+                "message": {"role": "user", "content": "Find the bug"},
+                "timestamp": "2026-01-01T10:00:00.000Z",
+                "cwd": "/test/project",
+                "gitBranch": "main",
+                "version": "2.1.0",
+            },
+            {
+                "type": "assistant",
+                "message": {
+                    "role": "assistant",
+                    "model": "claude-opus-4-5-20251101",
+                    "content": [
+                        {"type": "text", "text": "Looking into it."},
+                        {"type": "tool_use", "id": "tu_1", "name": "Read",
+                         "input": {"file_path": "/test/project/app.py"}},
+                        {"type": "tool_use", "id": "tu_2", "name": "Task",
+                         "input": {"subagent_type": "Explore", "description": "Search",
+                                   "prompt": "Find callers"}},
+                        {"type": "tool_use", "id": "tu_3", "name": "Skill",
+                         "input": {"skill": "code-review"}},
+                        {"type": "tool_use", "id": "tu_4", "name": "mcp__github__get_issue",
+                         "input": {}},
+                    ],
+                    "usage": {
+                        "input_tokens": 10,
+                        "output_tokens": 5,
+                        "cache_read_input_tokens": 100,
+                        "cache_creation_input_tokens": 50,
+                    },
+                },
+                "timestamp": "2026-01-01T10:00:01.000Z",
+            },
+            {
+                "type": "user",
+                "message": {"role": "user", "content": [
+                    {"type": "tool_result", "tool_use_id": "tu_2", "content": "done"},
+                ]},
+                "toolUseResult": {
+                    "agentId": "a1b2c3",
+                    "status": "completed",
+                    "totalDurationMs": 1200,
+                    "totalTokens": 3000,
+                    "totalToolUseCount": 4,
+                },
+                "timestamp": "2026-01-01T10:00:05.000Z",
+            },
+            {
+                "type": "system",
+                "subtype": "api_error",
+                "error": {"error": {"type": "overloaded_error", "message": "Overloaded"}},
+                "retryAttempt": 1,
+                "retryInMs": 500.0,
+                "timestamp": "2026-01-01T10:00:06.000Z",
+            },
+        ]
+        with open(project_dir / f"{SESSION_ID}.jsonl", "w") as f:
+            for event in session_events:
+                f.write(json.dumps(event) + "\n")
+
+        yield claude_dir
+
+
+@pytest.fixture
+def importer(mock_claude_dir):
+    """Create an importer backed by a temporary database."""
+    return LogImporter(claude_dir=mock_claude_dir, db_path=mock_claude_dir.parent / "test.db")
+
+
+def test_import_all(importer):
+    """Test importing a session and its child rows."""
+    stats = importer.import_all()
+
+    assert stats["sessions_imported"] == 1
+    assert stats["messages_imported"] == 2
+    assert stats["tool_usages_imported"] == 4
+    assert stats["errors_imported"] == 1
+    assert stats["subagents_imported"] == 1
+
+    with importer.session_factory() as db:
+        session = db.query(Session).one()
+        assert session.session_id == SESSION_ID
+        assert session.project_path == "/test/project"
+        assert session.first_prompt == "Find the bug"
+        assert session.total_cache_read_tokens == 100
+        assert session.duration_ms == 6000
+        assert session.subagent_count == 1
+        assert session.skill_count == 1
+        assert session.imported_at is not None
+
+        assert db.query(Message).count() == 2
+        categories = {t.tool_name: t.category for t in db.query(ToolUsage)}
+        assert categories == {
+            "Read": "native",
+            "Task": "agent",
+            "Skill": "skill",
+            "mcp__github__get_issue": "mcp",
+        }
+        read = db.query(ToolUsage).filter(ToolUsage.tool_name == "Read").one()
+        assert json.loads(read.input_preview) == {"file_path": "/test/project/app.py"}
+
+        agent = db.query(SubagentUsage).one()
+        assert agent.subagent_type == "Explore"
+        assert agent.agent_id == "a1b2c3"
+        assert agent.total_tokens == 3000
+
+        error = db.query(ErrorEvent).one()
+        assert error.error_type == "overloaded_error"
+        assert error.retry_in_ms == 500
+
+
+def test_import_daily_stats(importer):
+    """Test daily rollups after import."""
+    importer.import_all()
+
+    with importer.session_factory() as db:
+        daily = db.query(DailyStats).one()
+        assert daily.date == date(2026, 1, 1)
+        assert daily.project_path == "*"
+        assert daily.session_count == 1
+        assert daily.message_count == 2
+        assert daily.input_tokens == 10
+        assert daily.tool_call_count == 4
+        assert daily.error_count == 1
+
+        tool_stats = db.query(ToolStats).all()
+        assert {t.tool_name: t.call_count for t in tool_stats} == {
+            "Read": 1, "Task": 1, "Skill": 1, "mcp__github__get_issue": 1,
+        }
+        assert all(t.date == date(2026, 1, 1) for t in tool_stats)
+        assert db.query(ErrorStats).one().count == 1
+
+
+def test_import_skips_existing(importer):
+    """Test that a second import skips sessions unless forced."""
+    importer.import_all()
+    stats = importer.import_all()
+    assert stats["sessions_imported"] == 0
+    assert stats["sessions_skipped"] == 1
+
+    stats = importer.import_all(force=True)
+    assert stats["sessions_imported"] == 1
+    with importer.session_factory() as db:
+        assert db.query(Session).count() == 1
+        assert db.query(DailyStats).one().session_count == 1
+        # Indexes dropped for the forced re-import are rebuilt
+        index_names = {i["name"] for i in inspect(db.connection()).get_indexes("tool_usages")}
+        assert "ix_tool_usages_tool_name" in index_names
+
+
+def test_import_commits_in_batches(importer, monkeypatch):
+    """Test that intermediate commits leave the import intact."""
+    monkeypatch.setattr("claude_coach.core.importer.COMMIT_EVERY_SESSIONS", 1)
+    stats = importer.import_all()
+    assert stats["sessions_imported"] == 1
+
+    with importer.session_factory() as db:
+        assert db.query(Session).count() == 1
+        assert db.query(Message).count() == 2
+        assert db.query(DailyStats).one().session_count == 1
+
+
+def test_import_reimports_changed_file(importer, mock_claude_dir):
+    """Test that a grown session file is re-imported without stale child rows."""
+    importer.import_all()
+
+    session_file = mock_claude_dir / "projects" / "-test-project" / f"{SESSION_ID}.jsonl"
+    with open(session_file, "a") as f:
+        f.write(json.dumps({
+            "type": "user",
+            "message": {"role": "user", "content": "One more thing"},
+            "timestamp": "2026-01-01T10:00:07.000Z",
+        }) + "\n")
+
+    stats = importer.import_all()
+    assert stats["sessions_imported"] == 1
+    assert stats["sessions_skipped"] == 0
+
+    with importer.session_factory() as db:
+        session = db.query(Session).one()
+        assert session.file_size == session_file.stat().st_size
+        assert db.query(Message).count() == 3
+        assert db.query(ToolUsage).count() == 4
+        assert db.query(DailyStats).one().message_count == 3
+        assert db.query(SubagentUsage).count() == 1
+
+    assert importer.import_all()["sessions_skipped"] == 1
+
+
+def test_import_parallel(importer, monkeypatch):
+    """Test that parsing sessions in worker processes imports the same rows."""
+    monkeypatch.setattr("claude_coach.core.importer.PARALLEL_MIN_FILES", 1)
+    stats = importer.import_all()
+    assert stats["sessions_imported"] == 1
+    assert stats["tool_usages_imported"] == 4
+
+    with importer.session_factory() as db:
+        assert db.query(Session).one().session_id == SESSION_ID
+        assert db.query(Message).count() == 2
+        assert db.query(SubagentUsage).one().agent_id == "a1b2c3"
+
+
+def test_import_connection_pragmas(importer):
+    """Test that the import connection runs in WAL mode."""
+    with importer.session_factory() as db:
+        assert db.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert db.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_import_session_subdirectories(importer, mock_claude_dir):
+    """Test discovery of sessions stored in per-session directories."""
+    project_dir = mock_claude_dir / "projects" / "-test-project"
+    events = (project_dir / f"{SESSION_ID}.jsonl").read_text()
+    (project_dir / f"{SESSION_ID}.jsonl").unlink()
+
+    with_agents = project_dir / "1a2b3c4d-0000-4000-8000-000000000001"
+    (with_agents / "subagents").mkdir(parents=True)
+    (with_agents / f"{with_agents.name}.jsonl").write_text(events)
+    (with_agents / "agent-a1b2c3.jsonl").write_text(events)
+
+    plain = project_dir / "1a2b3c4d-0000-4000-8000-000000000002"
+    plain.mkdir()
+    (plain / f"{plain.name}.jsonl").write_text(events)
+
+    assert sorted(importer._iter_session_files()) == sorted([
+        (with_agents / f"{with_agents.name}.jsonl", with_agents.name),
+        (plain / f"{plain.name}.jsonl", plain.name),
+    ])
+    assert importer.import_all()["sessions_imported"] == 2
+
+
+def test_import_updates_stats_for_new_days_only(importer, mock_claude_dir):
+    """Test that an incremental import adds stats for the new session's day."""
+    importer.import_all()
+
+    later_id = "1a2b3c4d-0000-4000-8000-000000000003"
+    with open(mock_claude_dir / "projects" / "-test-project" / f"{later_id}.jsonl", "w") as f:
+        f.write(json.dumps({
+            "type": "user",
+            "message": {"role": "user", "content": "Next day"},
+            "timestamp": "2026-01-02T09:00:00.000Z",
+        }) + "\n")
+
+    stats = importer.import_all()
+    assert stats["sessions_imported"] == 1
+    assert stats["sessions_skipped"] == 1
+
+    with importer.session_factory() as db:
+        daily = {d.date: d for d in db.query(DailyStats)}
+        assert set(daily) == {date(2026, 1, 1), date(2026, 1, 2)}
+        assert daily[date(2026, 1, 1)].message_count == 2
+        assert daily[date(2026, 1, 2)].session_count == 1
+        assert db.query(ToolStats).count() == 4
@@ -0,0 +1,105 @@
+"""Tests for the insights engine."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from claude_coach.core.insights import InsightsEngine
+from claude_coach.models import Session, SubagentUsage, ToolUsage
+
+
+@pytest.fixture(autouse=True)
+def clear_insights_cache():
+    """Drop insights cached for each test's temporary database."""
+    yield
+    InsightsEngine.invalidate()
+
+
+def test_no_sessions(db):
+    """Test that session-based insights are skipped on an empty database."""
+    insights = InsightsEngine(db).generate_all_insights()
+    assert not {i.category for i in insights} & {"efficiency", "errors", "patterns", "agents"}
+
+
+def test_session_aggregates(db):
+    """Test insights computed from summed and averaged session columns."""
+    for i, (messages, duration_ms) in enumerate([(120, 3_600_000), (100, None), (80, 0)]):
+        db.add(Session(
+            session_id=f"s{i}",
+            project_path="/test/project",
+            message_count=messages,
+            total_input_tokens=1000,
+            total_output_tokens=10,
+            total_cache_read_tokens=900,
+            total_cache_creation_tokens=100,
+            duration_ms=duration_ms,
+        ))
+    db.flush()
+    db.add(SubagentUsage(session_id=1, subagent_type="Explore", total_tokens=60000))
+    db.commit()
+
+    insights = {i.title: i for i in InsightsEngine(db).generate_all_insights()}
+
+    assert insights["Excellent Cache Utilization"].metric_value == 90.0
+    assert "Low Output Ratio" in insights
+    assert "No Errors Recorded" in insights
+    assert "Long Sessions" in insights
+    # Only the one session with a nonzero duration counts toward the average
+    assert insights["Extended Sessions"].metric_value == 60.0
+    assert "High Token Usage per Agent" in insights
+
+
+def test_tool_usage_counts(db):
+    """Test tool, skill and MCP insights built from one grouped count."""
+    db.add(Session(session_id="s0", project_path="/test/project"))
+    db.flush()
+    calls = (
+        [("Bash", "native", None, None)] * 6
+        + [("Read", "native", None, None)] * 2
+        + [("Skill", "skill", "code-review", None)] * 3
+        + [("Skill", "skill", "writing-plans", None)]
+        + [("mcp__github__get_issue", "mcp", None, "github")] * 5
+        + [("mcp__github__list_prs", "mcp", None, "github")] * 2
+        + [("mcp__slack__post", "mcp", None, "slack")]
+    )
+    for tool_name, category, skill_name, mcp_server in calls:
+        db.add(ToolUsage(
+            session_id=1,
+            tool_name=tool_name,
+            category=category,
+            skill_name=skill_name,
+            mcp_server=mcp_server,
+        ))
+    db.commit()
+
+    insights = {i.title: i for i in InsightsEngine(db).generate_all_insights()}
+
+    assert insights["Most Used Tool: Bash"].metric_value == 6
+    assert "Underutilized Search Tools" in insights
+    skills = insights["Active Skill User (4 invocations)"]
+    assert "Most used: code-review (3x)" in skills.description
+    mcp = insights["Using 2 MCP Servers"]
+    assert mcp.metric_value == 8
+    assert "Most active: github (7 calls)" in mcp.description
+    assert insights["Underused MCP Servers"].metric_value == 1
+
+
+def test_insights_cached_until_import(db):
+    """Test that insights are reused until a session is imported."""
+    db.add(Session(session_id="s0", project_path="/test/project", message_count=60))
+    db.commit()
+
+    first = InsightsEngine(db).generate_all_insights()
+    second = InsightsEngine(db).generate_all_insights()
+    assert second == first
+    assert second[0] is first[0]
+
+    body = InsightsEngine(db).generate_all_insights_json()
+    assert json.loads(body) == [asdict(i) for i in first]
+    assert InsightsEngine(db).generate_all_insights_json() is body
+
+    db.add(Session(session_id="s1", project_path="/test/project", message_count=2))
+    db.commit()
+    titles = {i.title for i in InsightsEngine(db).generate_all_insights()}
+    assert "Long Sessions" not in titles
@@ -96,3 +96,108 @@ def test_get_session_not_found(mock_claude_dir):
     session = parser.get_session("nonexistent")
 
     assert session is None
+
+
+def test_session_path_from_index(mock_claude_dir):
+    """Test resolving a session file through sessions-index.json."""
+    parser = LogParser(mock_claude_dir)
+    path = parser._session_path("test-session-1")
+
+    assert path == mock_claude_dir / "projects" / "-test-project" / "test-session-1.jsonl"
+    assert parser._session_path("nonexistent") is None
+
+
+def test_session_paths_shared_across_parsers(mock_claude_dir, monkeypatch):
+    """Test that a resolved session path is reused by later LogParser instances."""
+    path = LogParser(mock_claude_dir)._session_path("test-session-1")
+
+    def fail(self):
+        raise AssertionError("session paths rebuilt")
+
+    monkeypatch.setattr(LogParser, "_build_session_paths", fail)
+    assert LogParser(mock_claude_dir)._session_path("test-session-1") == path
+
+
+def test_list_sessions_reuses_unchanged_files(mock_claude_dir):
+    """Test that first prompts are cached until a session file changes."""
+    session_file = mock_claude_dir / "projects" / "-test-project" / "unindexed.jsonl"
+    session_file.write_text(json.dumps({
+        "type": "user",
+        "message": {"role": "user", "content": "First question"},
+    }) + "\n")
+
+    sessions = {s.session_id: s for s in LogParser(mock_claude_dir).list_sessions()}
+    assert sessions["unindexed"].first_prompt == "First question"
+    assert sessions["test-session-1"].first_prompt == "Hello"
+
+    session_file.write_text(json.dumps({
+        "type": "user",
+        "message": {"role": "user", "content": "A different question"},
+    }) + "\n")
+
+    sessions = {s.session_id: s for s in LogParser(mock_claude_dir).list_sessions()}
+    assert sessions["unindexed"].first_prompt == "A different question"
+
+
+def test_first_prompt_scan_is_bounded(mock_claude_dir, monkeypatch):
+    """Test that the first-prompt scan stops after FIRST_PROMPT_SCAN_BYTES."""
+    monkeypatch.setattr("claude_coach.core.parser.FIRST_PROMPT_SCAN_BYTES", 300)
+    filler = json.dumps({"type": "summary", "summary": "x" * 200}) + "\n"
+    prompt = json.dumps({"type": "user", "message": {"content": "Late question"}}) + "\n"
+    project_dir = mock_claude_dir / "projects" / "-test-project"
+    (project_dir / "late.jsonl").write_text(filler * 2 + prompt)
+    (project_dir / "early.jsonl").write_text(filler + prompt)
+
+    sessions = {s.session_id: s for s in LogParser(mock_claude_dir).list_sessions()}
+    assert sessions["late"].first_prompt == ""
+    assert sessions["early"].first_prompt == "Late question"
+
+
+def test_get_session_parses_appended_lines(mock_claude_dir):
+    """Test that a grown session file matches a full parse of it."""
+    from claude_coach.core import parser as parser_module
+
+    session_file = mock_claude_dir / "projects" / "-test-project" / "test-session-1.jsonl"
+    before = LogParser(mock_claude_dir).get_session("test-session-1")
+
+    with open(session_file, "a") as f:
+        f.write(json.dumps({
+            "type": "assistant",
+            "message": {
+                "content": [{"type": "text", "text": "More"}],
+                "usage": {"input_tokens": 7, "output_tokens": 3},
+            },
+            "timestamp": "2026-01-01T10:00:09.000Z",
+        }) + "\n")
+        # Not yet newline-terminated, as if still being written
+        f.write(json.dumps({"type": "user", "message": {"content": "Partial"}}))
+
+    grown = LogParser(mock_claude_dir).get_session("test-session-1")
+    assert len(before.messages) == 2
+    assert [m.content for m in grown.messages] == ["Hello", "Hi there!", "More", "Partial"]
+    assert grown.total_input_tokens == 17
+
+    with open(session_file, "a") as f:
+        f.write("\n")
+    assert LogParser(mock_claude_dir).get_session("test-session-1") == grown
+
+    with open(session_file, "a") as f:
+        f.write(json.dumps({"type": "user", "message": {"content": "Last"}}) + "\n")
+    resumed = LogParser(mock_claude_dir).get_session("test-session-1")
+    assert resumed.messages[-1].content == "Last"
+
+    parser_module._session_cache.clear()
+    assert LogParser(mock_claude_dir).get_session("test-session-1") == resumed
+
+
+def test_get_session_unindexed(mock_claude_dir):
+    """Test that sessions missing from sessions-index.json are still found."""
+    session_file = mock_claude_dir / "projects" / "-test-project" / "unindexed.jsonl"
+    session_file.write_text(json.dumps({
+        "type": "user",
+        "message": {"role": "user", "content": "Not in the index"},
+    }) + "\n")
+
+    parser = LogParser(mock_claude_dir)
+    assert parser.get_session("unindexed").messages[0].content == "Not in the index"
+    assert parser._session_path("unindexed") == session_file